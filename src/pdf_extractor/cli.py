@@ -31,11 +31,12 @@ def cli():
 @click.option('--extract-tables', is_flag=True, default=None, help='Extract tables')
 @click.option('--extract-images', is_flag=True, default=None, help='Extract images')
 @click.option('--validate-schema', is_flag=True, default=True, help='Validate output')
+@click.option('--pretty', is_flag=True, default=False, help='Indent the JSON output for reading')
 @click.option('--config', '-c', type=click.Path(exists=True, path_type=Path), help='Configuration file')
 @click.option('--verbose', '-v', is_flag=True, default=False, help='Enable verbose output')
 def extract(input_path: Path, output: Optional[Path], password: Optional[str], mode: str, 
            format: str, preserve_layout: bool, extract_tables: Optional[bool], 
-           extract_images: Optional[bool], validate_schema: bool, 
+           extract_images: Optional[bool], validate_schema: bool, pretty: bool,
            config: Optional[Path], verbose: bool):
     """Extract structure from a PDF file and save as JSON.
     
@@ -69,7 +70,9 @@ def extract(input_path: Path, output: Optional[Path], password: Optional[str], m
     
     if verbose:
         click.echo(f"Output will be saved to: {output}")
-    
+
+    indent = 2 if pretty else None
+
     try:
         extractor_config = load_config_for_cli(
             config_path=config,
@@ -126,7 +129,7 @@ def extract(input_path: Path, output: Optional[Path], password: Optional[str], m
             if verbose:
                 click.echo("Converting to hierarchical structured format...")
             
-            builder = JSONBuilder(validate_schema=extractor_config.validate_schema, indent=2)
+            builder = JSONBuilder(validate_schema=extractor_config.validate_schema, indent=indent)
             
             from .models import ExtractionResult, PageContent, TextBlock, ContentType, BoundingBox, ImageInfo
             
@@ -219,12 +222,10 @@ def extract(input_path: Path, output: Optional[Path], password: Optional[str], m
                         "bbox": img_data.get('bbox')
                     })
             
-            with open(output, 'w', encoding='utf-8') as f:
-                json.dump(flat_result, f, indent=2, ensure_ascii=False)
+            JSONBuilder(validate_schema=False, indent=indent).save_to_file(flat_result, output)
             
         else:
-            with open(output, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            JSONBuilder(validate_schema=False, indent=indent).save_to_file(result, output)
         
         click.echo(f" Extraction complete! Saved to: {output}")
         
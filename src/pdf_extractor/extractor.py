@@ -1,14 +1,206 @@
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, replace
+from types import MappingProxyType, TracebackType
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Type
 import fitz
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .models import (
-    ExtractionConfig, ExtractionResult, PageContent, 
+    ExtractionConfig, ExtractionResult, PageContent, TextBlock, ContentType,
     ExtractionError, PasswordRequiredError, UnsupportedPDFError
 )
 from .page_processor import PageProcessor
 from .logging_utils import get_logger, pdf_logger
+from . import __version__
+
+
+_DOC_POOL_SIZE = 8
+
+# Part of every result cache key together with the package version; bump it
+# whenever the layout of ExtractionResult.to_dict changes.
+_CACHE_FORMAT_VERSION = 1
+
+# Below this many pages, starting page worker processes costs more than the
+# pages take to process inline.
+_PARALLEL_MIN_PAGES = 4
+
+# MuPDF failures raised while processing a page derive from FzErrorBase (only
+# FileDataError and EmptyFileError are RuntimeErrors); anything else on a page
+# is a bug and aborts the document instead of being recorded as a page error.
+_PAGE_ERRORS = (
+    fitz.mupdf.FzErrorBase, RuntimeError, ValueError, KeyError, IndexError, TimeoutError
+)
+
+_METADATA_KEYS = (
+    ('title', 'title'),
+    ('author', 'author'),
+    ('subject', 'subject'),
+    ('creator', 'creator'),
+    ('producer', 'producer'),
+    ('creation_date', 'creationDate'),
+    ('modification_date', 'modDate'),
+    ('keywords', 'keywords'),
+    ('format', 'format'),
+)
+
+_EMPTY_METADATA = MappingProxyType({
+    **{key: '' for key, _ in _METADATA_KEYS},
+    'encrypted': False
+})
+
+_worker_extractor: Optional['PDFStructureExtractor'] = None
+_page_worker_doc: Optional[fitz.Document] = None
+_page_worker_extractor: Optional['PDFStructureExtractor'] = None
+
+
+def _dumps(value: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _init_worker(config: ExtractionConfig) -> None:
+    """Create the per-process extractor used by :meth:`extract_batch`."""
+    # Documents are already spread across processes; a page pool inside
+    # each worker would only oversubscribe the CPUs.
+    global _worker_extractor
+    _worker_extractor = PDFStructureExtractor(replace(config, page_workers=None))
+
+
+def _extract_one(pdf_path: Path) -> Dict[str, Any]:
+    assert _worker_extractor is not None, "worker was not initialized"
+    return _worker_extractor.extract(pdf_path)
+
+
+def _init_page_worker(pdf_path: str, config: ExtractionConfig) -> None:
+    """Open the document once in a page worker process."""
+    pdf_doc = fitz.open(pdf_path)
+    if pdf_doc.needs_pass:
+        pdf_doc.authenticate(config.password or '')
+    global _page_worker_doc, _page_worker_extractor
+    _page_worker_doc = pdf_doc
+    _page_worker_extractor = PDFStructureExtractor(config)
+
+
+def _process_page_in_worker(page_num: int) -> PageContent:
+    extractor = _page_worker_extractor
+    assert extractor is not None and _page_worker_doc is not None, "worker was not initialized"
+    page = _page_worker_doc.load_page(page_num)
+    page_content = extractor.page_processor.process_page(page, page_num + 1)
+    extractor._create_legacy_text_blocks(page_content)
+    return page_content
+
+
+def _page_worker_main(conn: Any, pdf_path: str, config: ExtractionConfig) -> None:
+    """Serve page numbers from ``conn`` until told to stop or the pipe closes."""
+    _init_page_worker(pdf_path, config)
+    while True:
+        try:
+            page_num = conn.recv()
+        except EOFError:
+            break
+        if page_num is None:
+            break
+        
+        try:
+            conn.send((True, _process_page_in_worker(page_num)))
+        except Exception as e:
+            try:
+                conn.send((False, e))
+            except Exception:
+                # The exception itself could not be pickled.
+                conn.send((False, RuntimeError(str(e))))
+
+
+class _PageWorker:
+    """Processes pages in a child process that is killed when a page overruns.
+    
+    MuPDF parsing holds the GIL, so a stuck page can only be interrupted by
+    terminating the process running it. A fresh worker is started for the
+    next page.
+    """
+    
+    def __init__(self, pdf_path: str, config: ExtractionConfig, timeout: float):
+        self.pdf_path = pdf_path
+        self.config = config
+        self.timeout = timeout
+        self._process: Optional[multiprocessing.Process] = None
+        self._conn: Any = None
+    
+    def process(self, page_num: int) -> PageContent:
+        if self._process is None:
+            self._start()
+        
+        self._conn.send(page_num)
+        if not self._conn.poll(self.timeout):
+            self._terminate()
+            raise TimeoutError(
+                f"Page processing exceeded {self.timeout}s timeout"
+            )
+        
+        try:
+            ok, payload = self._conn.recv()
+        except EOFError:
+            self._terminate()
+            raise RuntimeError("Page worker exited unexpectedly")
+        
+        if not ok:
+            raise payload
+        if not isinstance(payload, PageContent):
+            raise RuntimeError(f"Page worker returned {type(payload).__name__}, expected PageContent")
+        return payload
+    
+    def close(self) -> None:
+        if self._process is None:
+            return
+        try:
+            self._conn.send(None)
+        except OSError:
+            pass
+        self._process.join(self.timeout)
+        self._terminate()
+    
+    def _start(self) -> None:
+        parent_conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_page_worker_main,
+            args=(child_conn, self.pdf_path, self.config),
+            daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+    
+    def _terminate(self) -> None:
+        process, self._process = self._process, None
+        conn, self._conn = self._conn, None
+        if process is None:
+            return
+        if process.is_alive():
+            process.terminate()
+        process.join()
+        conn.close()
 
 
 class PDFStructureExtractor:
@@ -19,8 +211,113 @@ class PDFStructureExtractor:
             debug=self.config.verbose,
             extract_images=self.config.extract_images
         )
+        # Idle document handles only; a handle in use by an extraction is
+        # checked out of the pool so no two threads ever share a Document.
+        self._doc_pool: "OrderedDict[str, Tuple[float, fitz.Document]]" = OrderedDict()
+        self._doc_checkouts: Dict[int, Tuple[str, float]] = {}
+        self._doc_pool_lock = threading.Lock()
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_lock = threading.Lock()
+    
+    def __enter__(self) -> "PDFStructureExtractor":
+        return self
+    
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType]
+    ) -> None:
+        self.close()
+    
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def close(self) -> None:
+        """Close every idle pooled document handle.
+        
+        Handles checked out by a running extraction are left to it and
+        returned to the pool when it finishes. The worker processes used by
+        :meth:`extract_async` are shut down as well.
+        """
+        with self._process_pool_lock:
+            process_pool, self._process_pool = self._process_pool, None
+        if process_pool is not None:
+            process_pool.shutdown(wait=True)
+        
+        with self._doc_pool_lock:
+            pooled = [doc for _, doc in self._doc_pool.values()]
+            self._doc_pool.clear()
+        
+        for pdf_doc in pooled:
+            self._close_doc(pdf_doc)
     
     def extract(self, pdf_path: Path) -> Dict[str, Any]:
+        cache_path = self._cache_path(pdf_path)
+        if cache_path is not None:
+            cached = self._read_cache(cache_path)
+            if cached is not None:
+                return cached
+        
+        result = self._extract_result(pdf_path).to_dict()
+        
+        if cache_path is not None:
+            self._write_cache(cache_path, result)
+        return result
+    
+    def extract_to_json(self, pdf_path: Path, out_stream: BinaryIO) -> None:
+        """Extract a PDF and write its JSON to a binary stream page by page.
+        
+        Each page is serialized and written as soon as it is processed, so
+        only one page dictionary is alive at a time. The document carries the
+        same keys as :meth:`extract`; metadata, timing and errors follow the
+        page array because they are only final once every page is done.
+        
+        Nothing is written until the document has been opened and
+        authenticated and its first page processed, so open and password
+        errors leave the stream untouched. An error raised after that leaves
+        partial, invalid JSON in the stream; callers writing to a file should
+        discard it.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            out_stream: Binary file-like object receiving UTF-8 JSON
+        """
+        write = out_stream.write
+        emit_empty_spans = self.config.emit_empty_spans
+        header = b'{"file_path":' + _dumps(str(pdf_path)) + b',"pages":['
+        pages_written = 0
+        
+        def write_page(page_content: PageContent) -> None:
+            nonlocal pages_written
+            write(b',' if pages_written else header)
+            write(_dumps(page_content.to_dict(emit_empty_spans)))
+            pages_written += 1
+        
+        result = self._extract_result(pdf_path, page_sink=write_page)
+        if not pages_written:
+            write(header)
+        write(b'],"metadata":' + _dumps(result.metadata))
+        write(b',"processing_time":' + _dumps(result.processing_time))
+        write(b',"page_count":' + _dumps(pages_written))
+        write(b',"errors":' + _dumps(result.errors))
+        write(b',"warnings":' + _dumps(result.warnings) + b'}')
+    
+    def _extract_result(
+        self, 
+        pdf_path: Path,
+        page_sink: Optional[Callable[[PageContent], None]] = None
+    ) -> ExtractionResult:
+        """Run the extraction and return the populated ExtractionResult.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            page_sink: Optional callback receiving each processed page instead
+                of collecting it in ``ExtractionResult.pages``
+        """
         logger = get_logger('pdf_extractor.extractor')
         start_time = time.time()
         
@@ -41,8 +338,8 @@ class PDFStructureExtractor:
         try:
 
             try:
-                pdf_doc = fitz.open(pdf_path)
-                logger.debug(f"Successfully opened PDF: {pdf_path}")
+                pdf_doc = self._get_doc(pdf_path)
+                logger.debug("Successfully opened PDF: %s", pdf_path)
             except fitz.FileNotFoundError:
                 raise ExtractionError(f"PDF file not found: {pdf_path}")
             except fitz.PyMuPDFError as e:
@@ -67,9 +364,9 @@ class PDFStructureExtractor:
 
             try:
                 metadata = self._extract_metadata(pdf_doc)
-                logger.debug(f"Extracted metadata for {pdf_doc.page_count} page PDF")
+                logger.debug("Extracted metadata for %d page PDF", pdf_doc.page_count)
             except Exception as e:
-                logger.warning(f"Failed to extract metadata: {str(e)}")
+                logger.warning("Failed to extract metadata: %s", e)
                 metadata = {}
             
 
@@ -82,36 +379,89 @@ class PDFStructureExtractor:
             )
             
 
-            pages_processed = 0
-            for page_num in range(pdf_doc.page_count):
-                try:
-                    page = pdf_doc[page_num]
-                    
+            pdf_path_str = str(pdf_path)
+            total_pages = pdf_doc.page_count
+            load_page = pdf_doc.load_page
+            process_page = self.page_processor.process_page
+            create_legacy_text_blocks = self._create_legacy_text_blocks
+            append_page = page_sink or result.pages.append
+            errors = result.errors
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-                    page_content = self.page_processor.process_page(page, page_num + 1)
-                    
+            page_worker = None
+            page_pool = None
+            if self.config.per_page_timeout_s:
+                if (self.config.page_workers or 0) > 1:
+                    logger.warning(
+                        "per_page_timeout_s is set; ignoring page_workers=%d",
+                        self.config.page_workers
+                    )
+                page_worker = _PageWorker(pdf_path_str, self.config, self.config.per_page_timeout_s)
+            elif (self.config.page_workers or 0) > 1 and total_pages >= _PARALLEL_MIN_PAGES:
+                pool_size = min(self.config.page_workers, total_pages)
+                page_pool = ProcessPoolExecutor(
+                    max_workers=pool_size,
+                    initializer=_init_page_worker,
+                    initargs=(pdf_path_str, self.config)
+                )
+                # Pages are submitted a bounded window ahead of the one being
+                # collected, so results are taken in page order without
+                # holding every processed page in memory at once.
+                window = 2 * pool_size
+                page_futures = deque(
+                    page_pool.submit(_process_page_in_worker, page_num)
+                    for page_num in range(min(window, total_pages))
+                )
 
+            pages_processed = 0
+            try:
+                for page_num in range(total_pages):
+                    if page_pool is not None:
+                        # Take this page's future before topping up the
+                        # window, and submit outside the per-page handler: a
+                        # pool that cannot accept work fails the document
+                        # rather than shifting results onto the wrong pages.
+                        page_future = page_futures.popleft()
+                        if page_num + window < total_pages:
+                            page_futures.append(
+                                page_pool.submit(_process_page_in_worker, page_num + window)
+                            )
+                    try:
+                        if page_pool is not None:
+                            page_content = page_future.result()
+                        elif page_worker is not None:
+                            page_content = page_worker.process(page_num)
+                        else:
+                            page = load_page(page_num)
+                            
 
-                    self._create_legacy_text_blocks(page_content)
-                    
-                    result.pages.append(page_content)
-                    pages_processed += 1
-                    
-                    logger.debug(f"Successfully processed page {page_num + 1}/{pdf_doc.page_count}")
-                    
-                except Exception as e:
+                            page_content = process_page(page, page_num + 1)
+                            
 
-                    pdf_logger.log_page_processing_error(
-                        pdf_path=str(pdf_path),
-                        page_number=page_num + 1,
-                        error=e
-                    )
-                    
 
-                    if not hasattr(result, 'errors'):
-                        result.errors = []
-                    result.errors.append(f"Page {page_num + 1}: {str(e)}")
-                    continue
+                            create_legacy_text_blocks(page_content)
+                        
+                        append_page(page_content)
+                        pages_processed += 1
+                        
+                        if debug_enabled:
+                            logger.debug("Successfully processed page %d/%d", page_num + 1, total_pages)
+                        
+                    except _PAGE_ERRORS as e:
+
+                        pdf_logger.log_page_processing_error(
+                            pdf_path=pdf_path_str,
+                            page_number=page_num + 1,
+                            error=e
+                        )
+                        
+                        errors.append(f"Page {page_num + 1}: {str(e)}")
+                        continue
+            finally:
+                if page_worker is not None:
+                    page_worker.close()
+                if page_pool is not None:
+                    page_pool.shutdown(wait=True, cancel_futures=True)
             
 
             processing_time = time.time() - start_time
@@ -119,12 +469,12 @@ class PDFStructureExtractor:
             
 
             pdf_logger.log_extraction_complete(
-                pdf_path=str(pdf_path),
+                pdf_path=pdf_path_str,
                 pages_processed=pages_processed,
                 processing_time=processing_time
             )
             
-            return result.to_dict()
+            return result
             
         except (ExtractionError, PasswordRequiredError, UnsupportedPDFError) as e:
 
@@ -147,11 +497,102 @@ class PDFStructureExtractor:
         finally:
 
             if pdf_doc is not None:
+                self._release_doc(pdf_doc)
+    
+    async def extract_async(self, pdf_path: Path) -> Dict[str, Any]:
+        """Run :meth:`extract` in a worker process without blocking the loop.
+        
+        PyMuPDF is not thread-safe and holds the GIL while parsing, so the
+        document is extracted in a process pool owned by this extractor
+        rather than on a thread. Its workers are set up like those of
+        :meth:`extract_batch`, and only the path and the result cross the
+        process boundary. The pool is shut down by :meth:`close`.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Same dictionary as :meth:`extract`
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_process_pool(), _extract_one, pdf_path)
+    
+    async def extract_many_async(self, pdf_paths: List[Path]) -> List[Dict[str, Any]]:
+        """Extract several PDFs concurrently from a single event loop.
+        
+        Documents run in parallel across the worker processes of
+        :meth:`extract_async`.
+        
+        Args:
+            pdf_paths: Paths to the PDF files
+            
+        Returns:
+            Extraction results in the same order as ``pdf_paths``
+        """
+        return await asyncio.gather(*(self.extract_async(path) for path in pdf_paths))
+    
+    def extract_batch(self, pdf_paths: List[Path], 
+                      workers: Optional[int] = None) -> Dict[Path, Dict[str, Any]]:
+        """Extract many PDFs, spreading whole documents across processes.
+        
+        Each worker process builds one extractor from this extractor's config
+        and reuses it for every document it receives. Documents that fail,
+        including through a crashed worker, are logged and left out of the
+        result.
+        
+        Args:
+            pdf_paths: Paths to the PDF files
+            workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            Dictionary mapping each successfully extracted path to its result
+        """
+        logger = get_logger('pdf_extractor.extractor')
+        results: Dict[Path, Dict[str, Any]] = {}
+        
+        if not pdf_paths:
+            return results
+        
+        max_workers = min(workers or os.cpu_count() or 1, len(pdf_paths))
+        
+        if max_workers == 1:
+            for pdf_path in pdf_paths:
+                try:
+                    results[pdf_path] = self.extract(pdf_path)
+                except ExtractionError as e:
+                    logger.warning("Skipping %s in batch: %s", pdf_path, e)
+            return results
+        
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(self.config,)
+        ) as executor:
+            futures = {executor.submit(_extract_one, path): path for path in pdf_paths}
+            for future in as_completed(futures):
+                pdf_path = futures[future]
                 try:
-                    pdf_doc.close()
-                    logger.debug("PDF document closed successfully")
+                    results[pdf_path] = future.result()
+                except ExtractionError as e:
+                    logger.warning("Skipping %s in batch: %s", pdf_path, e)
                 except Exception as e:
-                    logger.warning(f"Error closing PDF document: {str(e)}")
+                    # A crashed worker or a payload that cannot be pickled
+                    # fails only its own document; results gathered so far
+                    # are kept.
+                    logger.warning("Skipping %s in batch after worker failure: %r", pdf_path, e)
+        
+        return results
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Return the worker pool for :meth:`extract_async`, starting it once."""
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    initializer=_init_worker,
+                    initargs=(self.config,)
+                )
+            return self._process_pool
     
     def get_pdf_info(self, pdf_path: Path) -> Dict[str, Any]:
         """Get basic information about a PDF file without full extraction.
@@ -168,8 +609,8 @@ class PDFStructureExtractor:
         try:
 
             try:
-                pdf_doc = fitz.open(pdf_path)
-                logger.debug(f"Successfully opened PDF for info: {pdf_path}")
+                pdf_doc = self._get_doc(pdf_path)
+                logger.debug("Successfully opened PDF for info: %s", pdf_path)
             except fitz.FileNotFoundError:
                 raise ExtractionError(f"PDF file not found: {pdf_path}")
             except fitz.PyMuPDFError as e:
@@ -183,13 +624,13 @@ class PDFStructureExtractor:
             try:
                 file_size_mb = pdf_path.stat().st_size / (1024 * 1024)
             except Exception as e:
-                logger.warning(f"Could not get file size: {str(e)}")
+                logger.warning("Could not get file size: %s", e)
                 file_size_mb = 0
             
             try:
                 metadata = self._extract_metadata(pdf_doc)
             except Exception as e:
-                logger.warning(f"Could not extract metadata: {str(e)}")
+                logger.warning("Could not extract metadata: %s", e)
                 metadata = {}
             
             info = {
@@ -199,59 +640,162 @@ class PDFStructureExtractor:
                 'metadata': metadata
             }
             
-            logger.info(f"Successfully extracted PDF info: {pdf_doc.page_count} pages, {file_size_mb:.2f}MB")
+            logger.info("Successfully extracted PDF info: %d pages, %.2fMB", pdf_doc.page_count, file_size_mb)
             return info
             
         except (ExtractionError, UnsupportedPDFError) as e:
-            logger.error(f"Failed to get PDF info: {str(e)}")
+            logger.error("Failed to get PDF info: %s", e)
             raise
             
         except Exception as e:
-            logger.error(f"Unexpected error getting PDF info: {str(e)}")
+            logger.error("Unexpected error getting PDF info: %s", e)
             raise ExtractionError(f"Failed to get info for {pdf_path}: {str(e)}")
             
         finally:
 
             if pdf_doc is not None:
-                try:
-                    pdf_doc.close()
-                    logger.debug("PDF document closed successfully")
-                except Exception as e:
-                    logger.warning(f"Error closing PDF document: {str(e)}")
+                self._release_doc(pdf_doc)
+    
+    def _cache_path(self, pdf_path: Path) -> Optional[Path]:
+        """Return the result cache file for a PDF, or None if caching is off.
+        
+        The key covers the package and cache format versions, the resolved
+        path, the file's mtime and size, and every extraction setting except
+        the cache location and the page worker count, neither of which
+        changes the result.
+        """
+        if self.config.cache_dir is None:
+            return None
+        
+        try:
+            stat = os.stat(pdf_path)
+        except OSError:
+            return None
+        
+        config_items = sorted(
+            (key, value) for key, value in asdict(self.config).items()
+            if key not in ('cache_dir', 'page_workers')
+        )
+        key_source = (
+            f"{__version__}|{_CACHE_FORMAT_VERSION}|{Path(pdf_path).resolve()}|"
+            f"{stat.st_mtime_ns}|{stat.st_size}|{config_items!r}"
+        )
+        key = hashlib.blake2b(key_source.encode('utf-8'), digest_size=16).hexdigest()
+        return Path(self.config.cache_dir) / f"{key}.json"
+    
+    def _read_cache(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """Load a cached result; entries are plain JSON, so tuples come back as lists."""
+        logger = get_logger('pdf_extractor.extractor')
+        try:
+            with open(cache_path, 'rb') as f:
+                result = _loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable cache entry %s: %s", cache_path, e)
+            return None
+        
+        if not isinstance(result, dict):
+            logger.warning("Ignoring malformed cache entry %s", cache_path)
+            return None
+        
+        logger.debug("Loaded extraction result from cache: %s", cache_path)
+        return result
+    
+    def _write_cache(self, cache_path: Path, result: Dict[str, Any]) -> None:
+        """Atomically store a result in the cache; failures are only logged."""
+        logger = get_logger('pdf_extractor.extractor')
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(result))
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning("Failed to write cache entry %s: %s", cache_path, e)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    
+    def _get_doc(self, pdf_path: Path) -> fitz.Document:
+        """Check out a PDF handle, reusing a pooled one if the file is unchanged.
+        
+        Handles are keyed by resolved path and invalidated when the file's
+        mtime changes. A pooled handle is removed from the pool while it is
+        checked out, so concurrent callers always get distinct documents and
+        eviction never closes a handle that is in use. Every handle must be
+        given back with :meth:`_release_doc`. Password-protected documents are
+        never pooled since their authenticated state belongs to a single
+        extraction.
+        """
+        try:
+            mtime = os.stat(pdf_path).st_mtime
+        except OSError:
+            return fitz.open(pdf_path)
+        
+        key = str(Path(pdf_path).resolve())
+        pdf_doc = None
+        
+        with self._doc_pool_lock:
+            entry = self._doc_pool.pop(key, None)
+        
+        if entry is not None:
+            pooled_mtime, pooled_doc = entry
+            if pooled_mtime == mtime and not pooled_doc.is_closed:
+                pdf_doc = pooled_doc
+            else:
+                self._close_doc(pooled_doc)
+        
+        if pdf_doc is None:
+            pdf_doc = fitz.open(pdf_path)
+            if pdf_doc.needs_pass:
+                return pdf_doc
+        
+        with self._doc_pool_lock:
+            self._doc_checkouts[id(pdf_doc)] = (key, mtime)
+        return pdf_doc
+    
+    def _release_doc(self, pdf_doc: fitz.Document) -> None:
+        """Return a checked-out handle to the pool, or close it."""
+        evicted = []
+        with self._doc_pool_lock:
+            checkout = self._doc_checkouts.pop(id(pdf_doc), None)
+            if checkout is None or checkout[0] in self._doc_pool:
+                # Not poolable, or another caller already returned a handle
+                # for the same file.
+                evicted.append(pdf_doc)
+            elif not pdf_doc.is_closed:
+                key, mtime = checkout
+                self._doc_pool[key] = (mtime, pdf_doc)
+                while len(self._doc_pool) > _DOC_POOL_SIZE:
+                    _, (_, old_doc) = self._doc_pool.popitem(last=False)
+                    evicted.append(old_doc)
+        
+        for old_doc in evicted:
+            self._close_doc(old_doc)
+    
+    def _close_doc(self, pdf_doc: fitz.Document) -> None:
+        logger = get_logger('pdf_extractor.extractor')
+        try:
+            pdf_doc.close()
+            logger.debug("PDF document closed successfully")
+        except Exception as e:
+            logger.warning("Error closing PDF document: %s", e)
     
     def _extract_metadata(self, pdf_doc) -> Dict[str, Any]:
         """Extract metadata from PDF document with error handling."""
         logger = get_logger('pdf_extractor.extractor')
         
         try:
-            metadata = pdf_doc.metadata
-            return {
-                'title': metadata.get('title', ''),
-                'author': metadata.get('author', ''),
-                'subject': metadata.get('subject', ''),
-                'creator': metadata.get('creator', ''),
-                'producer': metadata.get('producer', ''),
-                'creation_date': metadata.get('creationDate', ''),
-                'modification_date': metadata.get('modDate', ''),
-                'keywords': metadata.get('keywords', ''),
-                'format': metadata.get('format', ''),
-                'encrypted': metadata.get('encryption', None) is not None
-            }
+            metadata = pdf_doc.metadata or {}
+            result = {key: metadata.get(source, '') for key, source in _METADATA_KEYS}
+            result['encrypted'] = metadata.get('encryption', None) is not None
+            return result
         except Exception as e:
-            logger.warning(f"Error extracting metadata: {str(e)}")
-
-            return {
-                'title': '',
-                'author': '',
-                'subject': '',
-                'creator': '',
-                'producer': '',
-                'creation_date': '',
-                'modification_date': '',
-                'keywords': '',
-                'format': '',
-                'encrypted': False
-            }
+            logger.warning("Error extracting metadata: %s", e)
+
+            return dict(_EMPTY_METADATA)
     
     def _create_legacy_text_blocks(self, page_content: PageContent):
         """Create legacy TextBlock objects for backward compatibility.
@@ -259,15 +803,19 @@ class PDFStructureExtractor:
         Args:
             page_content: PageContent with detailed content blocks
         """
-        from .models import TextBlock, ContentType
+        text_type = ContentType.TEXT
         
-
-        for content_block in page_content.content_blocks:
-            if content_block.is_text_block and content_block.text.strip():
-                text_block = TextBlock(
-                    text=content_block.text.strip(),
-                    content_type=ContentType.TEXT,
-                    bbox=content_block.bbox,
-                    confidence=1.0
-                )
-                page_content.text_blocks.append(text_block)
+        def legacy_blocks() -> Iterator[TextBlock]:
+            for content_block in page_content.content_blocks:
+                if not content_block.is_text_block:
+                    continue
+                text = content_block.text.strip()
+                if text:
+                    yield TextBlock(
+                        text=text,
+                        content_type=text_type,
+                        bbox=content_block.bbox,
+                        confidence=1.0
+                    )
+        
+        page_content.text_blocks.extend(legacy_blocks())
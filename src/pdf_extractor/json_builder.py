@@ -1,51 +1,200 @@
 import json
+import re
 import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 import logging
 
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
 try:
     import jsonschema
     JSONSCHEMA_AVAILABLE = True
 except ImportError:
     JSONSCHEMA_AVAILABLE = False
-    logging.warning("jsonschema package not available. Schema validation will be disabled.")
+    if not FASTJSONSCHEMA_AVAILABLE:
+        logging.warning("jsonschema package not available. Schema validation will be disabled.")
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .models import (
     ExtractionResult, DocumentStructure, SectionNode, TextBlock, 
     Table, ImageInfo, ContentType, BoundingBox, FontInfo,
-    ExtractionConfig
+    ExtractionConfig, HeaderLevel, _HEADER_TYPES, _HEADER_LEVELS
 )
 
 
+_NUMBERED_LIST_RE = re.compile(r'^\d+[.)]\s*')
+
+# List-line prefix -> (bullet_type, prefix length); two-character prefixes are
+# looked up before single characters.
+_BULLET_PREFIXES = {
+    '•': ("bullet", 1),
+    '*': ("bullet", 1),
+    '-': ("bullet", 1),
+    'a)': ("letter", 2),
+    'b)': ("letter", 2),
+    'c)': ("letter", 2),
+}
+
+_item_type = itemgetter("type")
+
+# Maps a converted content item's "type" to its key in the summary counts.
+_CONTENT_TYPE_COUNT_KEYS = {
+    "header": "headers",
+    "paragraph": "paragraphs",
+    "table": "tables",
+    "image": "images",
+    "list": "lists",
+}
+
+
+def _convert_bbox(bbox: Optional[BoundingBox]) -> Optional[Dict[str, Any]]:
+    if bbox is None:
+        return None
+    return bbox.to_dict()
+
+
+def _convert_font_info(font_info: Any) -> Optional[Dict[str, Any]]:
+    if not font_info:
+        return None
+    
+    if isinstance(font_info, dict):
+        return {
+            "font_name": font_info.get("font_name"),
+            "font_size": font_info.get("font_size"),
+            "is_bold": font_info.get("is_bold", False),
+            "is_italic": font_info.get("is_italic", False),
+            "color": font_info.get("color"),
+            "flags": font_info.get("flags")
+        }
+    elif isinstance(font_info, FontInfo):
+        return font_info.to_dict()
+    
+    return None
+
+
+def _omit(value: Any) -> None:
+    return None
+
+
 class JSONBuilder:
-    def __init__(self, validate_schema: bool = True, indent: int = 2):
+    # Parsed schema and compiled validator, shared by every builder in the
+    # process and loaded on first validation.
+    _shared_validator: Optional[Tuple[Dict[str, Any], Callable[[Any], Any], Any]] = None
+    _schema_load_failed = False
+    
+    def __init__(
+        self, 
+        validate_schema: bool = True, 
+        indent: Optional[int] = 2,
+        include_bbox: bool = True,
+        include_font_info: bool = True
+    ):
         """Initialize the JSON builder.
         
         Args:
             validate_schema: Whether to validate output against JSON schema
-            indent: JSON indentation for pretty printing
+            indent: JSON indentation for pretty printing; None (or 0) means
+                compact output with no whitespace between tokens
+            include_bbox: Emit bounding boxes; when False every "bbox" is null
+            include_font_info: Emit font details; when False every
+                "font_info" is null
         """
-        self.validate_schema = validate_schema and JSONSCHEMA_AVAILABLE
+        self.validate_schema = validate_schema and (
+            FASTJSONSCHEMA_AVAILABLE or JSONSCHEMA_AVAILABLE
+        )
         self.indent = indent
         self.logger = logging.getLogger(__name__)
         
-        self.schema = None
-        if self.validate_schema:
-            try:
-                schema_path = Path(__file__).parent / "schema.json"
-                with open(schema_path, 'r') as f:
-                    self.schema = json.load(f)
-            except Exception as e:
-                self.logger.warning(f"Failed to load JSON schema: {e}")
+        # Plain functions stored on the instance: no method binding per call,
+        # and disabled fields skip building their dicts altogether.
+        self._bbox_to_dict = _convert_bbox if include_bbox else _omit
+        self._font_info_to_dict = _convert_font_info if include_font_info else _omit
+        
+        self._validate: Optional[Callable[[Any], Any]] = None
+        self._validation_error: Any = ()
+    
+    @property
+    def schema(self) -> Optional[Dict[str, Any]]:
+        """The parsed JSON schema, loaded on first access."""
+        loaded = self._load_shared_validator()
+        return loaded[0] if loaded else None
+    
+    def _get_validator(self) -> Optional[Callable[[Any], Any]]:
+        if self._validate is None:
+            loaded = self._load_shared_validator()
+            if loaded is None:
                 self.validate_schema = False
+                return None
+            _, self._validate, self._validation_error = loaded
+        return self._validate
+    
+    @classmethod
+    def _load_shared_validator(
+        cls
+    ) -> Optional[Tuple[Dict[str, Any], Callable[[Any], Any], Any]]:
+        if cls._shared_validator is not None or cls._schema_load_failed:
+            return cls._shared_validator
+        
+        if not (FASTJSONSCHEMA_AVAILABLE or JSONSCHEMA_AVAILABLE):
+            cls._schema_load_failed = True
+            return None
+        
+        try:
+            schema_path = Path(__file__).parent / "schema.json"
+            with open(schema_path, 'r') as f:
+                schema = json.load(f)
+            
+            cls._shared_validator = (schema, *cls._compile_validator(schema))
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Failed to load JSON schema: {e}")
+            cls._schema_load_failed = True
+        
+        return cls._shared_validator
+    
+    @staticmethod
+    def _compile_validator(schema: Dict[str, Any]) -> Tuple[Callable[[Any], Any], Any]:
+        """Compile a schema into a validate callable and its error type.
+        
+        Prefers fastjsonschema's generated validator and falls back to a
+        cached jsonschema validator instance.
+        """
+        if FASTJSONSCHEMA_AVAILABLE:
+            return fastjsonschema.compile(schema), fastjsonschema.JsonSchemaException
+        
+        validator_cls = jsonschema.validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        return validator_cls(schema).validate, jsonschema.ValidationError
     
     def build_from_document_structure(
         self, 
         doc_structure: DocumentStructure,
         extraction_result: ExtractionResult,
-        extraction_config: ExtractionConfig = None
+        extraction_config: ExtractionConfig = None,
+        validate: Optional[bool] = None
     ) -> Dict[str, Any]:
+        """Build the hierarchical JSON output for a document structure.
+        
+        Args:
+            doc_structure: Hierarchical document structure
+            extraction_result: Extraction result supplying metadata and timing
+            extraction_config: Configuration recorded in the output
+            validate: Override the builder's ``validate_schema`` for this call.
+                Output written for external consumers should be validated;
+                internal repacking of already validated data can pass False.
+        """
         json_output = {
             "document": self._build_document_section(doc_structure),
             "metadata": self._build_metadata_section(extraction_result),
@@ -54,11 +203,13 @@ class JSONBuilder:
             )
         }
         
-        if self.validate_schema and self.schema:
+        should_validate = self.validate_schema if validate is None else validate
+        validate_output = self._get_validator() if should_validate else None
+        if validate_output is not None:
             try:
-                jsonschema.validate(json_output, self.schema)
+                validate_output(json_output)
                 self.logger.debug("JSON output validated successfully against schema")
-            except jsonschema.ValidationError as e:
+            except self._validation_error as e:
                 self.logger.warning(f"JSON schema validation failed: {e}")
         
         return json_output
@@ -66,43 +217,146 @@ class JSONBuilder:
     def build_from_extraction_result(
         self, 
         extraction_result: ExtractionResult,
-        extraction_config: ExtractionConfig = None
+        extraction_config: ExtractionConfig = None,
+        validate: Optional[bool] = None
     ) -> Dict[str, Any]:
         doc_structure = self._convert_pages_to_hierarchy(extraction_result)
         
         return self.build_from_document_structure(
-            doc_structure, extraction_result, extraction_config
+            doc_structure, extraction_result, extraction_config, validate=validate
         )
     
+    def build_bytes(
+        self, 
+        doc_structure: DocumentStructure,
+        extraction_result: ExtractionResult,
+        extraction_config: ExtractionConfig = None,
+        validate: Optional[bool] = None
+    ) -> bytes:
+        """Build the hierarchical output and return it as encoded JSON bytes.
+        
+        Suited to HTTP handlers, which can send the buffer as the response
+        body without a str round-trip, e.g.
+        ``Response(content=builder.build_bytes(...), media_type="application/json")``.
+        """
+        return self.to_json_bytes(self.build_from_document_structure(
+            doc_structure, extraction_result, extraction_config, validate=validate
+        ))
+    
     def to_json_string(self, data: Dict[str, Any]) -> str:
+        if self._use_orjson():
+            return self.to_json_bytes(data).decode('utf-8')
+        
         return json.dumps(
             data, 
             ensure_ascii=False, 
             indent=self.indent,
-            separators=(',', ': ')
+            separators=self._separators()
         )
     
-    def save_to_file(self, data: Dict[str, Any], file_path: Path) -> None:
-        json_string = self.to_json_string(data)
+    def to_json_bytes(self, data: Dict[str, Any]) -> bytes:
+        """Serialize data to UTF-8 encoded JSON bytes.
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(json_string)
+        Uses orjson when it is installed and the configured indent is one it
+        can produce (0 or 2); otherwise falls back to the stdlib encoder.
+        """
+        if self._use_orjson():
+            option = orjson.OPT_NON_STR_KEYS
+            if self.indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, option=option)
+        
+        return self.to_json_string(data).encode('utf-8')
+    
+    def save_to_file(self, data: Dict[str, Any], file_path: Path) -> None:
+        if self._use_orjson():
+            with open(file_path, 'wb') as f:
+                f.write(self.to_json_bytes(data))
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(
+                    data, 
+                    f,
+                    ensure_ascii=False, 
+                    indent=self.indent,
+                    separators=self._separators()
+                )
         
         self.logger.info(f"JSON output saved to: {file_path}")
     
+    def save_many(self, items: Iterable[Tuple[Path, Dict[str, Any]]]) -> None:
+        """Save several JSON outputs, overlapping encoding with file writes.
+        
+        Encoding holds the GIL but file writes release it, so each document is
+        written on a background thread while the next one is encoded. At most
+        one encoded buffer is pending at a time.
+        
+        Args:
+            items: ``(file_path, data)`` pairs to save
+        """
+        def write_bytes(file_path: Path, payload: bytes) -> None:
+            with open(file_path, 'wb') as f:
+                f.write(payload)
+        
+        # Each path is logged only once its write has completed.
+        pending: Optional[Tuple[Path, Future[None]]] = None
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            for file_path, data in items:
+                payload = self.to_json_bytes(data)
+                if pending is not None:
+                    pending[1].result()
+                    self.logger.info(f"JSON output saved to: {pending[0]}")
+                pending = (file_path, writer.submit(write_bytes, file_path, payload))
+            
+            if pending is not None:
+                pending[1].result()
+                self.logger.info(f"JSON output saved to: {pending[0]}")
+    
+    def _use_orjson(self) -> bool:
+        return ORJSON_AVAILABLE and self.indent in (None, 0, 2)
+    
+    def _separators(self) -> Tuple[str, str]:
+        # Without indentation emit fully compact output, matching orjson.
+        return (',', ': ') if self.indent else (',', ':')
+    
     def _build_document_section(self, doc_structure: DocumentStructure) -> Dict[str, Any]:
-        content = []
+        """Convert the section tree and tally the summary in a single pass.
         
-
-        for section in doc_structure.sections:
-            content.append(self._convert_section_to_content_item(section))
+        Sections are walked with an explicit stack; each popped section
+        appends its item to its parent's content list, so sibling order is
+        preserved while avoiding recursion.
+        """
+        content: List[Dict[str, Any]] = []
+        total_sections = 0
+        total_content_blocks = 0
+        item_types: Counter = Counter()
+        
+        stack = [(section, content) for section in reversed(doc_structure.sections)]
+        while stack:
+            section, siblings = stack.pop()
+            total_sections += 1
+            total_content_blocks += len(section.content_blocks)
+            
+            content_items = []
+            for block in section.content_blocks:
+                content_item = self._convert_content_block_to_item(block)
+                if content_item:
+                    content_items.append(content_item)
+            item_types.update(map(_item_type, content_items))
+            
+            siblings.append(self._build_section_item(section, content_items))
+            stack.extend(
+                (subsection, content_items) for subsection in reversed(section.subsections)
+            )
         
-
         summary = {
-            "total_sections": len(doc_structure.get_all_sections()),
+            "total_sections": total_sections,
             "total_pages": doc_structure.total_pages,
-            "total_content_blocks": doc_structure.count_total_content_blocks(),
-            "content_types": self._count_content_types(doc_structure)
+            "total_content_blocks": total_content_blocks,
+            "content_types": {
+                count_key: item_types[item_type]
+                for item_type, count_key in _CONTENT_TYPE_COUNT_KEYS.items()
+            }
         }
         
         return {
@@ -112,11 +366,11 @@ class JSONBuilder:
         }
     
     def _build_metadata_section(self, extraction_result: ExtractionResult) -> Dict[str, Any]:
-        metadata = extraction_result.metadata.copy()
-        metadata["file_path"] = extraction_result.file_path
-        metadata["page_count"] = len(extraction_result.pages)
-        
-        return metadata
+        return {
+            **extraction_result.metadata,
+            "file_path": extraction_result.file_path,
+            "page_count": len(extraction_result.pages)
+        }
     
     def _build_extraction_info(
         self, 
@@ -139,26 +393,18 @@ class JSONBuilder:
             "warnings": extraction_result.warnings
         }
     
-    def _convert_section_to_content_item(self, section: SectionNode) -> Dict[str, Any]:
-        content_items = []
-        
-
-        for block in section.content_blocks:
-            content_item = self._convert_content_block_to_item(block)
-            if content_item:
-                content_items.append(content_item)
-        
-
-        for subsection in section.subsections:
-            content_items.append(self._convert_section_to_content_item(subsection))
-        
+    def _build_section_item(
+        self, 
+        section: SectionNode, 
+        content_items: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
         return {
             "type": "section",
             "title": section.title,
             "level": section.level.value,
             "content": content_items,
             "page_number": section.page_number,
-            "bbox": self._convert_bbox(section.bbox),
+            "bbox": self._bbox_to_dict(section.bbox),
             "metadata": section.metadata
         }
     
@@ -166,6 +412,10 @@ class JSONBuilder:
         self, 
         block: Union[TextBlock, Table, ImageInfo]
     ) -> Optional[Dict[str, Any]]:
+        converter = _BLOCK_CONVERTERS.get(type(block))
+        if converter is not None:
+            return converter(self, block)
+        
         if isinstance(block, TextBlock):
             return self._convert_text_block(block)
         elif isinstance(block, Table):
@@ -178,14 +428,14 @@ class JSONBuilder:
     
     def _convert_text_block(self, block: TextBlock) -> Dict[str, Any]:
 
-        if block.content_type.is_header_type():
+        if block.content_type in _HEADER_TYPES:
             return {
                 "type": "header",
                 "text": block.text,
-                "level": block.content_type.get_header_level() or 1,
+                "level": _HEADER_LEVELS[block.content_type],
                 "page_number": block.metadata.get("page_number"),
-                "bbox": self._convert_bbox(block.bbox),
-                "font_info": self._convert_font_info(block.font_info),
+                "bbox": self._bbox_to_dict(block.bbox),
+                "font_info": self._font_info_to_dict(block.font_info),
                 "metadata": block.metadata
             }
         elif block.content_type == ContentType.LIST:
@@ -196,8 +446,8 @@ class JSONBuilder:
                 "type": "paragraph", 
                 "text": block.text,
                 "page_number": block.metadata.get("page_number"),
-                "bbox": self._convert_bbox(block.bbox),
-                "font_info": self._convert_font_info(block.font_info),
+                "bbox": self._bbox_to_dict(block.bbox),
+                "font_info": self._font_info_to_dict(block.font_info),
                 "confidence": block.confidence,
                 "metadata": block.metadata
             }
@@ -206,12 +456,10 @@ class JSONBuilder:
         data = table.to_2d_array()
         headers = None
         
-
-        if data and len(data) > 1:
-            first_row = data[0]
-
-            headers = first_row
-            data = data[1:]
+        # to_2d_array returns a fresh list, so the header row can be popped
+        # in place instead of copying the remaining rows with a slice.
+        if len(data) > 1:
+            headers = data.pop(0)
         
         return {
             "type": "table",
@@ -220,7 +468,7 @@ class JSONBuilder:
             "rows": table.rows,
             "cols": table.cols,
             "page_number": None,
-            "bbox": self._convert_bbox(table.bbox),
+            "bbox": self._bbox_to_dict(table.bbox),
             "extraction_method": table.extraction_method,
             "confidence": table.confidence,
             "metadata": {}
@@ -236,35 +484,24 @@ class JSONBuilder:
             "format": image.format,
             "size_bytes": image.size_bytes,
             "page_number": image.page_number,
-            "bbox": self._convert_bbox(image.bbox),
+            "bbox": self._bbox_to_dict(image.bbox),
             "metadata": image.metadata
         }
     
     def _convert_list_block(self, block: TextBlock) -> Dict[str, Any]:
-        lines = block.text.strip().split('\n')
         items = []
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-
-            bullet_type = "bullet"
-            text = line
-            
-
-            if line and line[0].isdigit():
+        for line in filter(None, map(str.strip, block.text.splitlines())):
+            prefix = _BULLET_PREFIXES.get(line[:2]) or _BULLET_PREFIXES.get(line[0])
+            if prefix is not None:
+                bullet_type, prefix_len = prefix
+                text = line[prefix_len:].strip()
+            elif line[0].isdigit():
                 bullet_type = "number"
-
-                import re
-                text = re.sub(r'^\d+[.)]\s*', '', line)
-            elif line.startswith(('•', '*', '-')):
+                text = _NUMBERED_LIST_RE.sub('', line)
+            else:
                 bullet_type = "bullet"
-                text = line[1:].strip()
-            elif line.startswith(('a)', 'b)', 'c)')):
-                bullet_type = "letter"
-                text = line[2:].strip()
+                text = line
             
             items.append({
                 "text": text,
@@ -277,79 +514,10 @@ class JSONBuilder:
             "items": items,
             "list_type": "ordered" if items and items[0]["bullet_type"] == "number" else "unordered",
             "page_number": block.metadata.get("page_number"),
-            "bbox": self._convert_bbox(block.bbox),
+            "bbox": self._bbox_to_dict(block.bbox),
             "metadata": block.metadata
         }
     
-    def _convert_bbox(self, bbox: Optional[BoundingBox]) -> Optional[Dict[str, Any]]:
-        if not bbox:
-            return None
-            
-        return {
-            "x0": bbox.x0,
-            "y0": bbox.y0,
-            "x1": bbox.x1,
-            "y1": bbox.y1,
-            "width": bbox.width,
-            "height": bbox.height
-        }
-    
-    def _convert_font_info(self, font_info: Any) -> Optional[Dict[str, Any]]:
-        if not font_info:
-            return None
-        
-        if isinstance(font_info, dict):
-            return {
-                "font_name": font_info.get("font_name"),
-                "font_size": font_info.get("font_size"),
-                "is_bold": font_info.get("is_bold", False),
-                "is_italic": font_info.get("is_italic", False),
-                "color": font_info.get("color"),
-                "flags": font_info.get("flags")
-            }
-        elif isinstance(font_info, FontInfo):
-            return {
-                "font_name": font_info.font_name,
-                "font_size": font_info.font_size,
-                "is_bold": font_info.is_bold,
-                "is_italic": font_info.is_italic,
-                "color": font_info.color,
-                "flags": font_info.flags
-            }
-        
-        return None
-    
-    def _count_content_types(self, doc_structure: DocumentStructure) -> Dict[str, int]:
-        counts = {
-            "headers": 0,
-            "paragraphs": 0,
-            "tables": 0,
-            "images": 0,
-            "lists": 0
-        }
-        
-        def count_in_section(section: SectionNode):
-            for block in section.content_blocks:
-                if isinstance(block, TextBlock):
-                    if block.content_type.is_header_type():
-                        counts["headers"] += 1
-                    elif block.content_type == ContentType.LIST:
-                        counts["lists"] += 1
-                    else:
-                        counts["paragraphs"] += 1
-                elif isinstance(block, Table):
-                    counts["tables"] += 1
-                elif isinstance(block, ImageInfo):
-                    counts["images"] += 1
-            
-            for subsection in section.subsections:
-                count_in_section(subsection)
-        
-        for section in doc_structure.sections:
-            count_in_section(section)
-        
-        return counts
-    
     def _convert_pages_to_hierarchy(self, extraction_result: ExtractionResult) -> DocumentStructure:
         doc_structure = DocumentStructure(
             title=extraction_result.metadata.get("title"),
@@ -359,26 +527,20 @@ class JSONBuilder:
         )
         
 
+        add_section = doc_structure.add_section
         for page in extraction_result.pages:
-            section_title = f"Page {page.page_number}"
-            
-            from .models import HeaderLevel
-            section = SectionNode(
-                title=section_title,
+            add_section(SectionNode(
+                title=f"Page {page.page_number}",
                 level=HeaderLevel.H1,
+                content_blocks=[*page.text_blocks, *page.tables, *page.images],
                 page_number=page.page_number
-            )
-            
-
-            for block in page.text_blocks:
-                section.add_content(block)
-            
-            for table in page.tables:
-                section.add_content(table)
-            
-            for image in page.images:
-                section.add_content(image)
-            
-            doc_structure.add_section(section)
+            ))
         
-        return doc_structure
\ No newline at end of file
+        return doc_structure
+
+
+_BLOCK_CONVERTERS: Dict[type, Callable[[JSONBuilder, Any], Dict[str, Any]]] = {
+    TextBlock: JSONBuilder._convert_text_block,
+    Table: JSONBuilder._convert_table_block,
+    ImageInfo: JSONBuilder._convert_image_block,
+}
@@ -1,12 +1,54 @@
 import logging
 import json
 import sys
-from datetime import datetime
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(value: Dict[str, Any]) -> str:
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value).decode('utf-8')
+        except TypeError:
+            # Values orjson rejects (non-str keys, >64-bit ints) still
+            # serialize through the stdlib encoder as they did before.
+            pass
+    return json.dumps(value)
 
 
 class JSONFormatter(logging.Formatter):
 
+    # Copying a prebuilt dict and filling it in is cheaper than building a
+    # six-key literal per record; it also fixes the field order.
+    _ENTRY_TEMPLATE: Dict[str, Any] = {
+        "timestamp": "",
+        "level": "",
+        "module": "",
+        "message": "",
+        "function": "",
+        "line": 0
+    }
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted UTC prefix); kept as one tuple so threads
+        # sharing a handler never see a second paired with another's prefix.
+        self._cached_second: Tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, created: float) -> str:
+        second, micros = divmod(round(created * 1e6), 1_000_000)
+        cached_second, prefix = self._cached_second
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._cached_second = (second, prefix)
+        return f"{prefix}.{micros:06d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON string.
         
@@ -16,14 +58,13 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string
         """
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "level": record.levelname,
-            "module": record.name,
-            "message": record.getMessage(),
-            "function": record.funcName,
-            "line": record.lineno
-        }
+        log_entry = self._ENTRY_TEMPLATE.copy()
+        log_entry["timestamp"] = self._format_timestamp(record.created)
+        log_entry["level"] = record.levelname
+        log_entry["module"] = record.name
+        log_entry["message"] = record.getMessage()
+        log_entry["function"] = record.funcName
+        log_entry["line"] = record.lineno
         
 
         if record.exc_info:
@@ -33,19 +74,18 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, 'extra_data'):
             log_entry.update(record.extra_data)
             
-        return json.dumps(log_entry)
+        return _dumps(log_entry)
 
 
 class PDFExtractorLogger:
-    """Centralized logger configuration for PDF extractor."""
+    """Centralized logger configuration for PDF extractor.
     
-    _instance = None
-    _configured = False
+    Holds no per-instance state: configuration is tracked on the class, so
+    every instance (normally just the module-level ``pdf_logger``) shares it.
+    """
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    __slots__ = ()
+    _configured = False
     
     def configure_logging(self, verbose: bool = False, json_format: bool = True):
         
@@ -78,7 +118,7 @@ class PDFExtractorLogger:
         console_handler.setFormatter(formatter)
         root_logger.addHandler(console_handler)
         
-        self._configured = True
+        PDFExtractorLogger._configured = True
         
 
         logger = logging.getLogger(__name__)
@@ -95,6 +135,8 @@ class PDFExtractorLogger:
     
     def log_extraction_start(self, pdf_path: str, config_info: Dict[str, Any]):
         logger = self.get_logger('pdf_extractor.extraction')
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info("Starting PDF extraction", extra={
             'extra_data': {
                 'pdf_path': pdf_path,
@@ -105,6 +147,8 @@ class PDFExtractorLogger:
     def log_extraction_complete(self, pdf_path: str, pages_processed: int, 
                               processing_time: float, output_path: str = None):
         logger = self.get_logger('pdf_extractor.extraction')
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info("PDF extraction completed successfully", extra={
             'extra_data': {
                 'pdf_path': pdf_path,
@@ -117,6 +161,8 @@ class PDFExtractorLogger:
     def log_extraction_error(self, pdf_path: str, error: Exception, 
                            stage: str = "unknown"):
         logger = self.get_logger('pdf_extractor.extraction')
+        if not logger.isEnabledFor(logging.ERROR):
+            return
         logger.error("PDF extraction failed", extra={
             'extra_data': {
                 'pdf_path': pdf_path,
@@ -129,6 +175,8 @@ class PDFExtractorLogger:
     def log_page_processing_error(self, pdf_path: str, page_number: int, 
                                 error: Exception):
         logger = self.get_logger('pdf_extractor.page_processor')
+        if not logger.isEnabledFor(logging.WARNING):
+            return
         logger.warning("Page processing failed, continuing with next page", extra={
             'extra_data': {
                 'pdf_path': pdf_path,
@@ -141,6 +189,8 @@ class PDFExtractorLogger:
     def log_table_extraction_error(self, pdf_path: str, page_number: int, 
                                  error: Exception):
         logger = self.get_logger('pdf_extractor.table_extractor')
+        if not logger.isEnabledFor(logging.WARNING):
+            return
         logger.warning("Table extraction failed for page, continuing", extra={
             'extra_data': {
                 'pdf_path': pdf_path,
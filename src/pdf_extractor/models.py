@@ -1,7 +1,21 @@
+import json
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
 from enum import Enum
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ormsgpack
+    ORMSGPACK_AVAILABLE = True
+except ImportError:
+    ORMSGPACK_AVAILABLE = False
+
 
 class ContentType(Enum):
     TEXT = "text"
@@ -19,30 +33,38 @@ class ContentType(Enum):
     PARAGRAPH = "paragraph"
     
     def is_header_type(self) -> bool:
-        return self in {
-            ContentType.HEADER,
-            ContentType.HEADER_1,
-            ContentType.HEADER_2,
-            ContentType.HEADER_3,
-            ContentType.HEADER_4,
-            ContentType.HEADER_5,
-            ContentType.HEADER_6
-        }
+        return self in _HEADER_TYPES
     
     def get_header_level(self) -> Optional[int]:
-        header_map = {
-            ContentType.HEADER_1: 1,
-            ContentType.HEADER_2: 2,
-            ContentType.HEADER_3: 3,
-            ContentType.HEADER_4: 4,
-            ContentType.HEADER_5: 5,
-            ContentType.HEADER_6: 6,
-            ContentType.HEADER: 1,
-        }
-        return header_map.get(self)
-
-
-@dataclass
+        return _HEADER_LEVELS.get(self)
+
+
+_HEADER_TYPES = frozenset({
+    ContentType.HEADER,
+    ContentType.HEADER_1,
+    ContentType.HEADER_2,
+    ContentType.HEADER_3,
+    ContentType.HEADER_4,
+    ContentType.HEADER_5,
+    ContentType.HEADER_6
+})
+
+_HEADER_LEVELS = {
+    ContentType.HEADER_1: 1,
+    ContentType.HEADER_2: 2,
+    ContentType.HEADER_3: 3,
+    ContentType.HEADER_4: 4,
+    ContentType.HEADER_5: 5,
+    ContentType.HEADER_6: 6,
+    ContentType.HEADER: 1,
+}
+
+# Serialized value of each content type; a dict lookup on the member is
+# cheaper than the Enum ``value`` descriptor in the to_dict loops.
+_CONTENT_TYPE_VALUES = {content_type: content_type.value for content_type in ContentType}
+
+
+@dataclass(slots=True)
 class ExtractionConfig:
     """Configuration for PDF extraction process."""
     preserve_layout: bool = False
@@ -54,28 +76,60 @@ class ExtractionConfig:
     min_table_cols: int = 2
     text_extraction_method: str = "pymupdf"
     password: Optional[str] = None
+    cache_dir: Optional[Path] = None
+    # Pages run one at a time in a child process that is killed when a page
+    # overruns; when set this takes precedence and page_workers is ignored.
+    per_page_timeout_s: Optional[float] = None
+    emit_empty_spans: bool = False
+    # Process pages of large documents in this many worker processes; has no
+    # effect when per_page_timeout_s is set.
+    page_workers: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundingBox:
     """Represents a bounding box for content positioning."""
     x0: float
     y0: float
     x1: float
     y1: float
-    width: Optional[float] = None
-    height: Optional[float] = None
     
-    def __post_init__(self):
-        if self.width is None:
-            self.width = self.x1 - self.x0
-        if self.height is None:
-            self.height = self.y1 - self.y0
+    @property
+    def width(self) -> float:
+        return self.x1 - self.x0
+    
+    @property
+    def height(self) -> float:
+        return self.y1 - self.y0
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Convert bounding box to dictionary for JSON serialization."""
+        # A constant-key dict display is faster than dict(zip(keys, values))
+        # for six fields; the corners are read once for the derived size.
+        x0, y0, x1, y1 = self.x0, self.y0, self.x1, self.y1
+        return {
+            "x0": x0,
+            "y0": y0,
+            "x1": x1,
+            "y1": y1,
+            "width": x1 - x0,
+            "height": y1 - y0
+        }
+
+
+# (bold, italic, superscript, serif) for every value of the low flag byte.
+_FLAG_DECODE = tuple(
+    (bool(flags & 16), bool(flags & 2), bool(flags & 1), bool(flags & 4))
+    for flags in range(256)
+)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FontInfo:
-    """Represents font information for a text span."""
+    """Represents font information for a text span.
+    
+    Immutable and hashable, so identical fonts can be shared between spans.
+    """
     font_name: str
     font_size: float
     flags: int = 0
@@ -102,9 +156,42 @@ class FontInfo:
     def is_serif(self) -> bool:
         """Check if font is serif using flags."""
         return bool(self.flags & 4)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert font info to the dictionary layout used in JSON output."""
+        flags = self.flags
+        return {
+            "font_name": self.font_name,
+            "font_size": self.font_size,
+            "is_bold": bool(flags & 16),
+            "is_italic": bool(flags & 2),
+            "color": self.color,
+            "flags": flags
+        }
+    
+    def to_span_dict(self) -> Dict[str, Any]:
+        """Convert font info to the per-span layout used by PageContent.to_dict.
+        
+        The flag bits are decoded with one table lookup rather than
+        through the four ``is_*`` properties.
+        """
+        flags = self.flags
+        is_bold, is_italic, is_superscript, is_serif = _FLAG_DECODE[flags & 0xFF]
+        return {
+            "name": self.font_name,
+            "size": self.font_size,
+            "flags": flags,
+            "color": self.color,
+            "is_bold": is_bold,
+            "is_italic": is_italic,
+            "is_superscript": is_superscript,
+            "is_serif": is_serif,
+            "ascender": self.ascender,
+            "descender": self.descender
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class TextSpan:
     """Represents a span of text with consistent formatting."""
     text: str
@@ -113,32 +200,44 @@ class TextSpan:
     origin: tuple = field(default_factory=tuple)
     
 
-@dataclass
+@dataclass(slots=True)
 class TextLine:
     """Represents a line of text containing multiple spans."""
     spans: List[TextSpan]
     bbox: BoundingBox
     wmode: int = 0
     direction: tuple = field(default_factory=lambda: (1, 0))
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def text(self) -> str:
-        """Get the full text of the line."""
-        return ''.join(span.text for span in self.spans)
+        """Get the full text of the line.
+        
+        Joined on first access and cached; spans must not change afterwards.
+        """
+        if self._text is None:
+            self._text = ''.join([span.text for span in self.spans])
+        return self._text
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentBlock:
     """Represents a block of content (text or image) with detailed structure."""
     block_number: int
     block_type: int
     bbox: BoundingBox
     lines: List[TextLine] = field(default_factory=list)
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def text(self) -> str:
-        """Get the full text of the block."""
-        return '\n'.join(line.text for line in self.lines)
+        """Get the full text of the block.
+        
+        Joined on first access and cached; lines must not change afterwards.
+        """
+        if self._text is None:
+            self._text = '\n'.join([line.text for line in self.lines])
+        return self._text
     
     @property
     def is_text_block(self) -> bool:
@@ -151,7 +250,7 @@ class ContentBlock:
         return self.block_type == 1
 
 
-@dataclass
+@dataclass(slots=True)
 class TextBlock:
     """Represents a block of text with metadata."""
     text: str
@@ -162,7 +261,7 @@ class TextBlock:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableCell:
     """Represents a single cell in a table."""
     text: str
@@ -173,7 +272,7 @@ class TableCell:
     bbox: Optional[BoundingBox] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """Represents a table extracted from PDF."""
     cells: List[TableCell]
@@ -182,10 +281,11 @@ class Table:
     bbox: Optional[BoundingBox] = None
     extraction_method: str = "unknown"
     confidence: float = 1.0
+    metadata: Dict[str, Any] = field(default_factory=dict)
     
     def to_2d_array(self) -> List[List[str]]:
         """Convert table to 2D array format."""
-        array = [["" for _ in range(self.cols)] for _ in range(self.rows)]
+        array = [[""] * self.cols for _ in range(self.rows)]
         for cell in self.cells:
             if cell.row < self.rows and cell.col < self.cols:
                 array[cell.row][cell.col] = cell.text
@@ -197,21 +297,17 @@ class Table:
         if header_row >= len(array):
             return []
         
+        # Every row from to_2d_array is exactly ``cols`` wide, so the header
+        # row names each column and zip pairs them without a fallback.
         headers = array[header_row]
-        result = []
-        
-        for i, row in enumerate(array):
-            if i != header_row:
-                row_dict = {}
-                for j, value in enumerate(row):
-                    header = headers[j] if j < len(headers) else f"Column_{j}"
-                    row_dict[header] = value
-                result.append(row_dict)
-        
-        return result
+        return [
+            dict(zip(headers, row))
+            for i, row in enumerate(array)
+            if i != header_row
+        ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageInfo:
     """Represents image metadata extracted from PDF."""
     image_id: str
@@ -238,19 +334,12 @@ class ImageInfo:
             "page_number": self.page_number,
             "index_on_page": self.index_on_page,
             "xref": self.xref,
-            "bbox": {
-                "x0": self.bbox.x0,
-                "y0": self.bbox.y0,
-                "x1": self.bbox.x1,
-                "y1": self.bbox.y1,
-                "width": self.bbox.width,
-                "height": self.bbox.height
-            } if self.bbox else None,
+            "bbox": self.bbox.to_dict() if self.bbox else None,
             "metadata": self.metadata
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PageContent:
     """Represents content extracted from a single PDF page."""
     page_number: int
@@ -263,9 +352,93 @@ class PageContent:
 
     content_blocks: List[ContentBlock] = field(default_factory=list)
     raw_text_data: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self, emit_empty_spans: bool = False) -> Dict[str, Any]:
+        """Convert page content to dictionary for JSON serialization.
+        
+        Args:
+            emit_empty_spans: Include spans and table cells whose text is
+                empty or whitespace-only. Line, block and table ``data``
+                text is unaffected either way.
+        """
+        return {
+            "page_number": self.page_number,
+            "page_width": self.page_width,
+            "page_height": self.page_height,
+            "rotation": self.rotation,
+            "text_blocks": [
+                {
+                    "text": block.text,
+                    "content_type": _CONTENT_TYPE_VALUES[block.content_type],
+                    "bbox": block.bbox.to_dict() if block.bbox else None,
+                    "font_info": block.font_info,
+                    "confidence": block.confidence,
+                    "metadata": block.metadata
+                } for block in self.text_blocks
+            ],
+            "tables": [
+                {
+                    "rows": table.rows,
+                    "cols": table.cols,
+                    "extraction_method": table.extraction_method,
+                    "confidence": table.confidence,
+                    "bbox": table.bbox.to_dict() if table.bbox else None,
+                    "data": table.to_2d_array(),
+                    "cells": [
+                        {
+                            "text": cell.text,
+                            "row": cell.row,
+                            "col": cell.col,
+                            "rowspan": cell.rowspan,
+                            "colspan": cell.colspan,
+                            "bbox": cell.bbox.to_dict() if cell.bbox else None
+                        } for cell in table.cells
+                        if emit_empty_spans or cell.text.strip()
+                    ]
+                } for table in self.tables
+            ],
+            "images": [
+                {
+                    "image_id": img.image_id,
+                    "width": img.width,
+                    "height": img.height,
+                    "format": img.format,
+                    "size_bytes": img.size_bytes,
+                    "description": img.description,
+                    "bbox": img.bbox.to_dict() if img.bbox else None
+                } for img in self.images
+            ],
+            "content_blocks": [
+                {
+                    "block_number": block.block_number,
+                    "block_type": block.block_type,
+                    "is_text": block.is_text_block,
+                    "is_image": block.is_image_block,
+                    "bbox": block.bbox.to_dict(),
+                    "text": block.text,
+                    "lines": [
+                        {
+                            "text": line.text,
+                            "wmode": line.wmode,
+                            "direction": line.direction,
+                            "bbox": line.bbox.to_dict(),
+                            "spans": [
+                                {
+                                    "text": span.text,
+                                    "bbox": span.bbox.to_dict(),
+                                    "font": span.font_info.to_span_dict(),
+                                    "origin": span.origin
+                                } for span in line.spans
+                                if emit_empty_spans or span.text.strip()
+                            ]
+                        } for line in block.lines
+                    ]
+                } for block in self.content_blocks
+            ]
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionResult:
     """Complete result of PDF extraction."""
     file_path: str
@@ -278,6 +451,10 @@ class ExtractionResult:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert extraction result to dictionary for JSON serialization."""
+        emit_empty_spans = (
+            self.extraction_config is not None
+            and self.extraction_config.emit_empty_spans
+        )
         return {
             "file_path": self.file_path,
             "metadata": self.metadata,
@@ -285,142 +462,41 @@ class ExtractionResult:
             "page_count": len(self.pages),
             "errors": self.errors,
             "warnings": self.warnings,
-            "pages": [
-                {
-                    "page_number": page.page_number,
-                    "page_width": page.page_width,
-                    "page_height": page.page_height,
-                    "rotation": page.rotation,
-                    "text_blocks": [
-                        {
-                            "text": block.text,
-                            "content_type": block.content_type.value,
-                            "bbox": {
-                                "x0": block.bbox.x0,
-                                "y0": block.bbox.y0,
-                                "x1": block.bbox.x1,
-                                "y1": block.bbox.y1,
-                                "width": block.bbox.width,
-                                "height": block.bbox.height
-                            } if block.bbox else None,
-                            "font_info": block.font_info,
-                            "confidence": block.confidence,
-                            "metadata": block.metadata
-                        } for block in page.text_blocks
-                    ],
-                    "tables": [
-                        {
-                            "rows": table.rows,
-                            "cols": table.cols,
-                            "extraction_method": table.extraction_method,
-                            "confidence": table.confidence,
-                            "bbox": {
-                                "x0": table.bbox.x0,
-                                "y0": table.bbox.y0,
-                                "x1": table.bbox.x1,
-                                "y1": table.bbox.y1,
-                                "width": table.bbox.width,
-                                "height": table.bbox.height
-                            } if table.bbox else None,
-                            "data": table.to_2d_array(),
-                            "cells": [
-                                {
-                                    "text": cell.text,
-                                    "row": cell.row,
-                                    "col": cell.col,
-                                    "rowspan": cell.rowspan,
-                                    "colspan": cell.colspan,
-                                    "bbox": {
-                                        "x0": cell.bbox.x0,
-                                        "y0": cell.bbox.y0,
-                                        "x1": cell.bbox.x1,
-                                        "y1": cell.bbox.y1,
-                                        "width": cell.bbox.width,
-                                        "height": cell.bbox.height
-                                    } if cell.bbox else None
-                                } for cell in table.cells
-                            ]
-                        } for table in page.tables
-                    ],
-                    "images": [
-                        {
-                            "image_id": img.image_id,
-                            "width": img.width,
-                            "height": img.height,
-                            "format": img.format,
-                            "size_bytes": img.size_bytes,
-                            "description": img.description,
-                            "bbox": {
-                                "x0": img.bbox.x0,
-                                "y0": img.bbox.y0,
-                                "x1": img.bbox.x1,
-                                "y1": img.bbox.y1,
-                                "width": img.bbox.width,
-                                "height": img.bbox.height
-                            } if img.bbox else None
-                        } for img in page.images
-                    ],
-                    "content_blocks": [
-                        {
-                            "block_number": block.block_number,
-                            "block_type": block.block_type,
-                            "is_text": block.is_text_block,
-                            "is_image": block.is_image_block,
-                            "bbox": {
-                                "x0": block.bbox.x0,
-                                "y0": block.bbox.y0,
-                                "x1": block.bbox.x1,
-                                "y1": block.bbox.y1,
-                                "width": block.bbox.width,
-                                "height": block.bbox.height
-                            },
-                            "text": block.text,
-                            "lines": [
-                                {
-                                    "text": line.text,
-                                    "wmode": line.wmode,
-                                    "direction": line.direction,
-                                    "bbox": {
-                                        "x0": line.bbox.x0,
-                                        "y0": line.bbox.y0,
-                                        "x1": line.bbox.x1,
-                                        "y1": line.bbox.y1,
-                                        "width": line.bbox.width,
-                                        "height": line.bbox.height
-                                    },
-                                    "spans": [
-                                        {
-                                            "text": span.text,
-                                            "bbox": {
-                                                "x0": span.bbox.x0,
-                                                "y0": span.bbox.y0,
-                                                "x1": span.bbox.x1,
-                                                "y1": span.bbox.y1,
-                                                "width": span.bbox.width,
-                                                "height": span.bbox.height
-                                            },
-                                            "font": {
-                                                "name": span.font_info.font_name,
-                                                "size": span.font_info.font_size,
-                                                "flags": span.font_info.flags,
-                                                "color": span.font_info.color,
-                                                "is_bold": span.font_info.is_bold,
-                                                "is_italic": span.font_info.is_italic,
-                                                "is_superscript": span.font_info.is_superscript,
-                                                "is_serif": span.font_info.is_serif,
-                                                "ascender": span.font_info.ascender,
-                                                "descender": span.font_info.descender
-                                            },
-                                            "origin": span.origin
-                                        } for span in line.spans
-                                    ]
-                                } for line in block.lines
-                            ]
-                        } for block in page.content_blocks
-                    ]
-                } for page in self.pages
-            ]
+            "pages": [page.to_dict(emit_empty_spans) for page in self.pages]
         }
+    
+    def to_json(self, pretty: bool = False) -> bytes:
+        """Serialize the extraction result to UTF-8 encoded JSON.
+        
+        Prefer this over ``json.dumps(result.to_dict())``: the dictionary is
+        encoded by orjson when it is installed.
+        
+        Args:
+            pretty: Indent the output by two spaces
+        """
+        data = self.to_dict()
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, option=option)
+        
+        if pretty:
+            return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
+    def to_msgpack(self) -> bytes:
+        """Serialize the extraction result to MessagePack.
+        
+        Carries the same structure as :meth:`to_dict` in a smaller binary
+        form for passing results between services. Requires the optional
+        ``ormsgpack`` package (``msgpack`` extra).
+        """
+        if not ORMSGPACK_AVAILABLE:
+            raise ImportError(
+                "MessagePack output requires ormsgpack; install the 'msgpack' extra"
+            )
+        return ormsgpack.packb(self.to_dict(), option=ormsgpack.OPT_NON_STR_KEYS)
 
 
 class ExtractionError(Exception):
@@ -458,7 +534,7 @@ class HeaderLevel(Enum):
         raise ValueError(f"Header level must be between 1 and 6, got {level}")
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionNode:
     """Represents a hierarchical section in the document structure."""
     title: str
@@ -481,22 +557,30 @@ class SectionNode:
         """Get all text content from this section and subsections."""
         text_parts = []
         
-
-        for content in self.content_blocks:
-            if hasattr(content, 'text'):
-                text_parts.append(content.text)
-        
-
-        for subsection in self.subsections:
-            text_parts.append(subsection.get_text_content())
+        stack = [self]
+        while stack:
+            section = stack.pop()
+            texts = [content.text for content in section.content_blocks
+                     if hasattr(content, 'text')]
+            if texts:
+                text_parts.extend(texts)
+            elif not section.subsections:
+                # An empty leaf still contributes its (empty) line.
+                text_parts.append('')
+            stack.extend(reversed(section.subsections))
         
         return '\n'.join(text_parts)
     
     def count_total_blocks(self) -> int:
         """Count total content blocks including subsections."""
-        count = len(self.content_blocks)
-        for subsection in self.subsections:
-            count += subsection.count_total_blocks()
+        count = 0
+        
+        stack = [self]
+        while stack:
+            section = stack.pop()
+            count += len(section.content_blocks)
+            stack.extend(section.subsections)
+        
         return count
     
     def to_dict(self) -> Dict[str, Any]:
@@ -514,7 +598,7 @@ class SectionNode:
             "content_blocks": [
                 {
                     "text": block.text,
-                    "content_type": block.content_type.value,
+                    "content_type": _CONTENT_TYPE_VALUES[block.content_type],
                     "bbox": {
                         "x0": block.bbox.x0,
                         "y0": block.bbox.y0,
@@ -530,7 +614,7 @@ class SectionNode:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentStructure:
     """Represents the complete hierarchical structure of a document."""
     title: Optional[str] = None
@@ -544,29 +628,28 @@ class DocumentStructure:
         self.sections.append(section)
     
     def get_section_by_title(self, title: str) -> Optional[SectionNode]:
-        """Find a section by title (recursive search)."""
-        def search_sections(sections: List[SectionNode]) -> Optional[SectionNode]:
-            for section in sections:
-                if section.title.lower() == title.lower():
-                    return section
-
-                result = search_sections(section.subsections)
-                if result:
-                    return result
-            return None
+        """Find a section by title (case-insensitive, depth-first)."""
+        wanted = title.lower()
+        
+        stack = self.sections[::-1]
+        while stack:
+            section = stack.pop()
+            if section.title.lower() == wanted:
+                return section
+            stack.extend(reversed(section.subsections))
         
-        return search_sections(self.sections)
+        return None
     
     def get_all_sections(self) -> List[SectionNode]:
         """Get all sections flattened (including subsections)."""
         all_sections = []
         
-        def collect_sections(sections: List[SectionNode]):
-            for section in sections:
-                all_sections.append(section)
-                collect_sections(section.subsections)
+        stack = self.sections[::-1]
+        while stack:
+            section = stack.pop()
+            all_sections.append(section)
+            stack.extend(reversed(section.subsections))
         
-        collect_sections(self.sections)
         return all_sections
     
     def count_total_content_blocks(self) -> int:
@@ -576,6 +659,24 @@ class DocumentStructure:
             total += section.count_total_blocks()
         return total
     
+    def summary_dict(self) -> Dict[str, int]:
+        """Count sections and content blocks in a single traversal."""
+        total_sections = 0
+        total_content_blocks = 0
+        
+        stack = list(self.sections)
+        while stack:
+            section = stack.pop()
+            total_sections += 1
+            total_content_blocks += len(section.content_blocks)
+            stack.extend(section.subsections)
+        
+        return {
+            "total_sections": total_sections,
+            "top_level_sections": len(self.sections),
+            "total_content_blocks": total_content_blocks
+        }
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert document structure to dictionary for JSON serialization."""
         return {
@@ -584,9 +685,5 @@ class DocumentStructure:
             "processing_time": self.processing_time,
             "sections": [section.to_dict() for section in self.sections],
             "metadata": self.metadata,
-            "summary": {
-                "total_sections": len(self.get_all_sections()),
-                "top_level_sections": len(self.sections),
-                "total_content_blocks": self.count_total_content_blocks()
-            }
+            "summary": self.summary_dict()
         }
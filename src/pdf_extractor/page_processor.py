@@ -1,4 +1,6 @@
-from typing import List, Dict, Any, Tuple
+import sys
+from functools import lru_cache
+from typing import List, Dict, Any
 import fitz
 
 from .models import (
@@ -9,6 +11,11 @@ from .chart_extractor import ChartExtractor
 from .logging_utils import get_logger
 
 
+# A page has thousands of spans but only a handful of distinct fonts; reusing
+# one FontInfo per combination is cheaper than constructing one per span.
+_interned_font_info = lru_cache(maxsize=1024)(FontInfo)
+
+
 class PageProcessor:
     def __init__(self, debug: bool = False, extract_images: bool = False):
         self.debug = debug
@@ -127,96 +134,77 @@ class PageProcessor:
         return text_blocks
     
     def _process_block(self, block_data: Dict[str, Any]) -> ContentBlock:
-        block_bbox = self._create_bbox(block_data['bbox'])
-        
         content_block = ContentBlock(
             block_number=block_data['number'],
             block_type=block_data['type'],
-            bbox=block_bbox
+            bbox=BoundingBox(*block_data['bbox'])
         )
         
 
         if block_data['type'] == 0 and 'lines' in block_data:
-            content_block.lines = [
-                self._process_line(line_data) 
-                for line_data in block_data['lines']
-            ]
+            # Lines and spans are built in one flat loop rather than through
+            # per-line and per-span calls; this runs for every span of every
+            # page. Keys MuPDF always emits are indexed directly. Font names
+            # are interned and FontInfo objects cached, so spans in the same
+            # font share one instance.
+            bounding_box = BoundingBox
+            text_span = TextSpan
+            text_line = TextLine
+            font_info = _interned_font_info
+            intern = sys.intern
+            lines = content_block.lines
+            for line_data in block_data['lines']:
+                spans = []
+                for span_data in line_data['spans']:
+                    spans.append(text_span(
+                        span_data['text'],
+                        bounding_box(*span_data['bbox']),
+                        font_info(
+                            intern(span_data['font']),
+                            span_data['size'],
+                            span_data['flags'],
+                            span_data['color'],
+                            span_data.get('ascender'),
+                            span_data.get('descender')
+                        ),
+                        span_data['origin']
+                    ))
+                lines.append(text_line(
+                    spans,
+                    bounding_box(*line_data['bbox']),
+                    line_data.get('wmode', 0),
+                    line_data.get('dir', (1, 0))
+                ))
         
         return content_block
     
-    def _process_line(self, line_data: Dict[str, Any]) -> TextLine:
-        line_bbox = self._create_bbox(line_data['bbox'])
-        
-        text_line = TextLine(
-            spans=[],
-            bbox=line_bbox,
-            wmode=line_data.get('wmode', 0),
-            direction=tuple(line_data.get('dir', (1, 0)))
-        )
-        
-
-        for span_data in line_data.get('spans', []):
-            text_span = self._process_span(span_data)
-            if text_span:
-                text_line.spans.append(text_span)
-        
-        return text_line
-    
-    def _process_span(self, span_data: Dict[str, Any]) -> TextSpan:
-        span_bbox = self._create_bbox(span_data['bbox'])
-        
-
-        font_info = FontInfo(
-            font_name=span_data.get('font', ''),
-            font_size=span_data.get('size', 0.0),
-            flags=span_data.get('flags', 0),
-            color=span_data.get('color', 0),
-            ascender=span_data.get('ascender'),
-            descender=span_data.get('descender')
-        )
-        
-        return TextSpan(
-            text=span_data.get('text', ''),
-            bbox=span_bbox,
-            font_info=font_info,
-            origin=tuple(span_data.get('origin', (0, 0)))
-        )
-    
-    def _create_bbox(self, bbox_tuple: Tuple[float, float, float, float]) -> BoundingBox:
-        return BoundingBox(
-            x0=bbox_tuple[0],
-            y0=bbox_tuple[1],
-            x1=bbox_tuple[2],
-            y1=bbox_tuple[3]
-        )
-    
     def get_page_statistics(self, page_content: PageContent) -> Dict[str, Any]:
         total_blocks = len(page_content.content_blocks)
-        text_blocks = sum(1 for block in page_content.content_blocks if block.is_text_block)
-        image_blocks = sum(1 for block in page_content.content_blocks if block.is_image_block)
-        
-        total_lines = sum(len(block.lines) for block in page_content.content_blocks)
-        total_spans = sum(
-            len(line.spans) 
-            for block in page_content.content_blocks 
-            for line in block.lines
-        )
-        
-
+        text_blocks = 0
+        image_blocks = 0
+        total_lines = 0
         font_sizes = []
         font_names = set()
+
+        # One walk over blocks -> lines -> spans collects every counter.
         for block in page_content.content_blocks:
+            if block.is_text_block:
+                text_blocks += 1
+            elif block.is_image_block:
+                image_blocks += 1
+            total_lines += len(block.lines)
             for line in block.lines:
                 for span in line.spans:
-                    font_sizes.append(span.font_info.font_size)
-                    font_names.add(span.font_info.font_name)
+                    font_info = span.font_info
+                    font_sizes.append(font_info.font_size)
+                    font_names.add(font_info.font_name)
         
         return {
             'total_blocks': total_blocks,
             'text_blocks': text_blocks,
             'image_blocks': image_blocks,
             'total_lines': total_lines,
-            'total_spans': total_spans,
+            'total_spans': len(font_sizes),
             'unique_fonts': len(font_names),
             'font_names': list(font_names),
             'font_size_range': (min(font_sizes) if font_sizes else 0, 
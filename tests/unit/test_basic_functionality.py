@@ -1,12 +1,26 @@
 
+import asyncio
+import io
+import logging
 import pytest
 import json
+import multiprocessing
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
 import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
-from pdf_extractor.extractor import PDFStructureExtractor
-from pdf_extractor.models import ExtractionConfig, ExtractionError
+import fitz
+
+from pdf_extractor.extractor import PDFStructureExtractor, _PageWorker
+from pdf_extractor.page_processor import PageProcessor
+from pdf_extractor.models import (
+    ExtractionConfig, ExtractionError, ExtractionResult, PageContent, BoundingBox,
+    Table, TableCell, ContentBlock, TextLine, TextSpan, FontInfo,
+    DocumentStructure, SectionNode, HeaderLevel, TextBlock, ContentType
+)
 
 
 class TestPDFStructureExtractor:
@@ -120,7 +134,7 @@ class TestPDFStructureExtractor:
         mock_page2.rect.height = 842.0
         mock_page2.rotation = 0
         
-        mock_doc.__getitem__.side_effect = [mock_page1, mock_page2]
+        mock_doc.load_page.side_effect = [mock_page1, mock_page2]
         mock_fitz.open.return_value = mock_doc
         
         # Test extraction
@@ -173,6 +187,269 @@ class TestPDFStructureExtractor:
         with pytest.raises(ExtractionError):
             extractor.extract(Path("nonexistent.pdf"))
 
+    def test_extract_async_with_nonexistent_file(self):
+        """Test that async extraction surfaces the same errors as extract."""
+        extractor = PDFStructureExtractor()
+        
+        with pytest.raises(ExtractionError):
+            asyncio.run(extractor.extract_async(Path("nonexistent.pdf")))
+
+    def test_extract_many_async_matches_extract(self):
+        """Test that async extraction in worker processes matches extract."""
+        test_pdf = Path(__file__).parent.parent / "data" / "simple_test.pdf"
+        
+        with PDFStructureExtractor() as extractor:
+            expected = extractor.extract(test_pdf)['pages']
+            results = asyncio.run(extractor.extract_many_async([test_pdf, test_pdf]))
+        
+        assert [result['pages'] for result in results] == [expected, expected]
+
+    def test_document_handle_reused_between_calls(self):
+        """Test that info and extract share one pooled document handle."""
+        test_pdf = Path(__file__).parent.parent / "data" / "simple_test.pdf"
+        
+        with PDFStructureExtractor() as extractor:
+            extractor.get_pdf_info(test_pdf)
+            first_doc = extractor._get_doc(test_pdf)
+            extractor._release_doc(first_doc)
+            extractor.extract(test_pdf)
+            
+            second_doc = extractor._get_doc(test_pdf)
+            assert second_doc is first_doc
+            assert not first_doc.is_closed
+            extractor._release_doc(second_doc)
+        
+        assert first_doc.is_closed
+
+    def test_checked_out_document_is_not_shared(self):
+        """Test that a handle in use is neither handed out again nor evicted."""
+        test_pdf = Path(__file__).parent.parent / "data" / "simple_test.pdf"
+        
+        with PDFStructureExtractor() as extractor:
+            in_use = extractor._get_doc(test_pdf)
+            other = extractor._get_doc(test_pdf)
+            assert other is not in_use
+            
+            extractor._release_doc(other)
+            extractor.close()
+            assert not in_use.is_closed
+            extractor._release_doc(in_use)
+
+    def test_concurrent_extractions_share_one_extractor(self, tmp_path):
+        """Test many threads extracting distinct and repeated PDFs at once."""
+        test_pdf = Path(__file__).parent.parent / "data" / "simple_test.pdf"
+        pdf_paths = []
+        for i in range(12):
+            pdf_path = tmp_path / f"copy_{i}.pdf"
+            pdf_path.write_bytes(test_pdf.read_bytes())
+            pdf_paths.append(pdf_path)
+        
+        with PDFStructureExtractor() as extractor:
+            expected = extractor.extract(test_pdf)['pages']
+            with ThreadPoolExecutor(max_workers=len(pdf_paths)) as executor:
+                results = list(executor.map(extractor.extract, pdf_paths * 2))
+        
+        assert all(result['errors'] == [] for result in results)
+        assert all(result['pages'] == expected for result in results)
+
+    def test_extract_batch_skips_failed_documents(self):
+        """Test batch extraction across worker processes."""
+        test_pdf = Path(__file__).parent.parent / "data" / "simple_test.pdf"
+        missing_pdf = Path("nonexistent.pdf")
+        
+        extractor = PDFStructureExtractor()
+        results = extractor.extract_batch([test_pdf, missing_pdf], workers=2)
+        
+        assert list(results) == [test_pdf]
+        assert results[test_pdf]['page_count'] > 0
+
+    def test_extract_batch_survives_worker_failures(self):
+        """Test that a non-extraction failure skips only its own document."""
+        test_pdf = Path(__file__).parent.parent / "data" / "simple_test.pdf"
+        
+        class UnpicklablePath(type(test_pdf)):
+            """A local class, so sending it to a worker fails to pickle."""
+        
+        bad_pdf = UnpicklablePath("unpicklable.pdf")
+        
+        extractor = PDFStructureExtractor()
+        results = extractor.extract_batch([test_pdf, bad_pdf], workers=2)
+        
+        assert list(results) == [test_pdf]
+
+    def test_extract_to_json_matches_extract(self):
+        """Test that streamed JSON output matches the buffered result."""
+        test_pdf = Path(__file__).parent.parent / "data" / "simple_test.pdf"
+        extractor = PDFStructureExtractor()
+        
+        expected = json.loads(json.dumps(extractor.extract(test_pdf)))
+        buffer = io.BytesIO()
+        extractor.extract_to_json(test_pdf, buffer)
+        streamed = json.loads(buffer.getvalue())
+        
+        expected.pop('processing_time')
+        streamed.pop('processing_time')
+        assert streamed == expected
+
+    def test_extract_to_json_writes_nothing_on_open_failure(self):
+        """Test that a document that cannot be opened leaves the stream empty."""
+        buffer = io.BytesIO()
+        
+        with pytest.raises(ExtractionError):
+            PDFStructureExtractor().extract_to_json(Path("nonexistent.pdf"), buffer)
+        
+        assert buffer.getvalue() == b""
+
+    @patch('pdf_extractor.extractor.fitz')
+    def test_extract_to_json_writes_nothing_without_password(self, mock_fitz):
+        """Test that a password failure leaves the stream empty."""
+        mock_doc = Mock()
+        mock_doc.needs_pass = True
+        mock_fitz.open.return_value = mock_doc
+        buffer = io.BytesIO()
+        
+        with pytest.raises(Exception, match="(?i)password"):
+            PDFStructureExtractor().extract_to_json(Path("protected.pdf"), buffer)
+        
+        assert buffer.getvalue() == b""
+
+    def test_extract_uses_result_cache(self, tmp_path):
+        """Test that a repeat extraction is served from the cache directory."""
+        test_pdf = Path(__file__).parent.parent / "data" / "simple_test.pdf"
+        extractor = PDFStructureExtractor(ExtractionConfig(cache_dir=tmp_path))
+        
+        first = extractor.extract(test_pdf)
+        assert len(list(tmp_path.glob("*.json"))) == 1
+        
+        with patch.object(extractor, '_extract_result') as mock_extract:
+            second = extractor.extract(test_pdf)
+        
+        mock_extract.assert_not_called()
+        assert second == json.loads(json.dumps(first))
+
+    def test_result_cache_key_includes_format_version(self, tmp_path):
+        """Test that a cache format bump stops serving older entries."""
+        test_pdf = Path(__file__).parent.parent / "data" / "simple_test.pdf"
+        extractor = PDFStructureExtractor(ExtractionConfig(cache_dir=tmp_path))
+        
+        current = extractor._cache_path(test_pdf)
+        with patch('pdf_extractor.extractor._CACHE_FORMAT_VERSION', -1):
+            assert extractor._cache_path(test_pdf) != current
+
+    def test_result_cache_ignores_non_dict_entry(self, tmp_path):
+        """Test that a cache entry that is not a JSON object counts as a miss."""
+        extractor = PDFStructureExtractor(ExtractionConfig(cache_dir=tmp_path))
+        cache_path = tmp_path / "entry.json"
+        cache_path.write_bytes(b"[1, 2, 3]")
+
+        assert extractor._read_cache(cache_path) is None
+
+    def test_extract_with_page_timeout_matches_inline(self):
+        """Test that timeout-guarded page processing yields the same pages."""
+        test_pdf = Path(__file__).parent.parent / "data" / "simple_test.pdf"
+        
+        inline = PDFStructureExtractor().extract(test_pdf)
+        isolated = PDFStructureExtractor(
+            ExtractionConfig(per_page_timeout_s=30.0)
+        ).extract(test_pdf)
+        
+        assert isolated['errors'] == []
+        assert isolated['pages'] == inline['pages']
+
+    def test_page_timeout_takes_precedence_over_page_workers(self, caplog):
+        """Test that combining the timeout with a page pool is reported."""
+        test_pdf = Path(__file__).parent.parent / "data" / "simple_test.pdf"
+        config = ExtractionConfig(per_page_timeout_s=30.0, page_workers=2)
+        
+        with patch('pdf_extractor.extractor.ProcessPoolExecutor') as mock_pool:
+            with caplog.at_level(logging.WARNING):
+                result = PDFStructureExtractor(config).extract(test_pdf)
+        
+        mock_pool.assert_not_called()
+        assert result['errors'] == []
+        assert "ignoring page_workers=2" in caplog.text
+
+    @pytest.mark.skipif(
+        multiprocessing.get_all_start_methods()[0] != 'fork',
+        reason="the stalling stub reaches the worker only through fork"
+    )
+    def test_page_timeout_records_error_and_replaces_worker(self):
+        """Test that an overrunning page is killed and later pages still run."""
+        test_pdf = Path(__file__).parent.parent / "data" / "simple_test.pdf"
+        process_page = PageProcessor.process_page
+        
+        def stall_on_page_two(self, page, page_number):
+            if page_number == 2:
+                time.sleep(60)
+            return process_page(self, page, page_number)
+        
+        extractor = PDFStructureExtractor(ExtractionConfig(per_page_timeout_s=2.0))
+        start = _PageWorker._start
+        with patch.object(PageProcessor, 'process_page', stall_on_page_two), \
+                patch.object(_PageWorker, '_start', autospec=True, side_effect=start) as started:
+            result = extractor.extract(test_pdf)
+        
+        assert result['errors'] == ["Page 2: Page processing exceeded 2.0s timeout"]
+        assert [page['page_number'] for page in result['pages']][:3] == [1, 3, 4]
+        assert started.call_count == 2
+
+    def test_mupdf_error_on_one_page_is_recorded(self):
+        """Test that a MuPDF error on a page is recorded instead of aborting."""
+        test_pdf = Path(__file__).parent.parent / "data" / "simple_test.pdf"
+        extractor = PDFStructureExtractor()
+        process_page = extractor.page_processor.process_page
+        
+        def fail_on_page_two(page, page_number):
+            if page_number == 2:
+                raise fitz.mupdf.FzErrorFormat("broken content stream")
+            return process_page(page, page_number)
+        
+        with patch.object(extractor.page_processor, 'process_page', side_effect=fail_on_page_two):
+            result = extractor.extract(test_pdf)
+        
+        assert len(result['errors']) == 1
+        assert result['errors'][0].startswith("Page 2:")
+        assert [page['page_number'] for page in result['pages']][:2] == [1, 3]
+
+    def test_extract_with_page_workers_matches_inline(self):
+        """Test that pooled page processing yields the same pages in order."""
+        test_pdf = Path(__file__).parent.parent / "data" / "simple_test.pdf"
+        
+        inline = PDFStructureExtractor().extract(test_pdf)
+        pooled = PDFStructureExtractor(
+            ExtractionConfig(page_workers=2)
+        ).extract(test_pdf)
+        
+        assert pooled['errors'] == []
+        assert pooled['pages'] == inline['pages']
+
+    def test_page_pool_submit_failure_fails_document(self):
+        """Test that a pool rejecting look-ahead work never misaligns pages."""
+        test_pdf = Path(__file__).parent.parent / "data" / "simple_test.pdf"
+        
+        class BreakingPool:
+            """Runs pages inline and breaks on the sixth submission."""
+            
+            def __init__(self, max_workers, initializer, initargs):
+                initializer(*initargs)
+                self.submitted = 0
+            
+            def submit(self, fn, page_num):
+                self.submitted += 1
+                if self.submitted == 6:
+                    raise BrokenProcessPool("worker died")
+                future = Future()
+                future.set_result(fn(page_num))
+                return future
+            
+            def shutdown(self, wait=True, cancel_futures=False):
+                pass
+        
+        extractor = PDFStructureExtractor(ExtractionConfig(page_workers=2))
+        with patch('pdf_extractor.extractor.ProcessPoolExecutor', BreakingPool):
+            with pytest.raises(ExtractionError):
+                extractor.extract(test_pdf)
+
     @patch('pdf_extractor.extractor.fitz')
     def test_extract_password_protected_pdf(self, mock_fitz):
         """Test extraction with password-protected PDF."""
@@ -218,3 +495,139 @@ class TestExtractionConfig:
         assert config.extract_images is True
         assert config.verbose is True
         assert config.min_table_rows == 3
+
+
+class TestModels:
+    """Test cases for the extraction data models."""
+
+    def test_bounding_box_derives_size(self):
+        """Test that width and height are derived from the corners."""
+        bbox = BoundingBox(10, 20, 110, 70)
+
+        assert bbox.width == 100
+        assert bbox.height == 50
+        assert not hasattr(bbox, '__dict__')
+
+    def test_table_metadata_defaults_to_empty(self):
+        """Test that tables carry their own metadata dict."""
+        table = Table(cells=[], rows=0, cols=0)
+
+        table.metadata['page_number'] = 1
+        assert table.metadata == {'page_number': 1}
+        assert Table(cells=[], rows=0, cols=0).metadata == {}
+
+    def test_extraction_result_to_json(self):
+        """Test that to_json encodes the same data as to_dict."""
+        result = ExtractionResult(
+            file_path="test.pdf",
+            pages=[PageContent(page_number=1)],
+            metadata={"title": "Tëst"}
+        )
+
+        assert json.loads(result.to_json()) == json.loads(json.dumps(result.to_dict()))
+        assert json.loads(result.to_json(pretty=True)) == json.loads(result.to_json())
+        assert b'\n  ' in result.to_json(pretty=True)
+
+    def test_table_to_dict_list(self):
+        """Test that rows are keyed by the header row."""
+        table = Table(
+            cells=[
+                TableCell(text="Name", row=0, col=0),
+                TableCell(text="Value", row=0, col=1),
+                TableCell(text="A", row=1, col=0),
+                TableCell(text="1", row=1, col=1),
+                TableCell(text="B", row=2, col=0),
+            ],
+            rows=3,
+            cols=2
+        )
+
+        assert table.to_dict_list() == [
+            {"Name": "A", "Value": "1"},
+            {"Name": "B", "Value": ""},
+        ]
+        assert table.to_dict_list(header_row=3) == []
+
+    def test_page_to_dict_skips_empty_spans(self):
+        """Test that whitespace-only spans are dropped unless requested."""
+        font = FontInfo(font_name="Arial", font_size=12.0)
+        bbox = BoundingBox(0, 0, 10, 10)
+        line = TextLine(
+            spans=[
+                TextSpan(text="Hello", bbox=bbox, font_info=font),
+                TextSpan(text=" ", bbox=bbox, font_info=font),
+                TextSpan(text="World", bbox=bbox, font_info=font),
+            ],
+            bbox=bbox
+        )
+        page = PageContent(
+            page_number=1,
+            content_blocks=[ContentBlock(block_number=0, block_type=0, bbox=bbox, lines=[line])]
+        )
+
+        compact_line = page.to_dict()["content_blocks"][0]["lines"][0]
+        assert [span["text"] for span in compact_line["spans"]] == ["Hello", "World"]
+        assert compact_line["text"] == "Hello World"
+
+        full_line = page.to_dict(emit_empty_spans=True)["content_blocks"][0]["lines"][0]
+        assert len(full_line["spans"]) == 3
+
+    def test_extraction_result_to_msgpack(self):
+        """Test that to_msgpack round-trips to the to_dict structure."""
+        ormsgpack = pytest.importorskip("ormsgpack")
+        result = ExtractionResult(
+            file_path="test.pdf",
+            pages=[PageContent(page_number=1)],
+            metadata={"title": "Tëst"}
+        )
+
+        assert ormsgpack.unpackb(result.to_msgpack()) == json.loads(result.to_json())
+
+    def test_document_sections_are_walked_depth_first(self):
+        """Test section flattening order and case-insensitive title lookup."""
+        intro = SectionNode(title="Intro", level=HeaderLevel.H1)
+        background = SectionNode(title="Background", level=HeaderLevel.H2)
+        scope = SectionNode(title="Scope", level=HeaderLevel.H2)
+        methods = SectionNode(title="Methods", level=HeaderLevel.H1)
+        intro.add_subsection(background)
+        intro.add_subsection(scope)
+
+        doc = DocumentStructure()
+        doc.add_section(intro)
+        doc.add_section(methods)
+        background.add_subsection(SectionNode(title="Scope", level=HeaderLevel.H3))
+
+        assert [s.title for s in doc.get_all_sections()] == [
+            "Intro", "Background", "Scope", "Scope", "Methods"
+        ]
+        assert doc.get_section_by_title("scope") is background.subsections[0]
+        assert doc.get_section_by_title("METHODS") is methods
+        assert doc.get_section_by_title("Results") is None
+
+    def test_section_text_and_block_counts_include_subsections(self):
+        """Test that section text and block counts cover nested sections in order."""
+        root = SectionNode(title="Intro", level=HeaderLevel.H1)
+        child = SectionNode(title="Background", level=HeaderLevel.H2)
+        grandchild = SectionNode(title="History", level=HeaderLevel.H3)
+        root.add_content(TextBlock(text="First", content_type=ContentType.PARAGRAPH))
+        root.add_content(Table(cells=[], rows=0, cols=0))
+        child.add_content(TextBlock(text="Second", content_type=ContentType.PARAGRAPH))
+        grandchild.add_content(TextBlock(text="Third", content_type=ContentType.PARAGRAPH))
+        child.add_subsection(grandchild)
+        root.add_subsection(child)
+        root.add_subsection(SectionNode(title="Empty", level=HeaderLevel.H2))
+
+        assert root.get_text_content() == "First\nSecond\nThird\n"
+        assert root.count_total_blocks() == 4
+
+    def test_font_span_dict_decodes_flags(self):
+        """Test that span flag decoding agrees with the FontInfo properties."""
+        for flags in (0, 1, 2, 4, 16, 23, 255, 256 + 18):
+            font = FontInfo(font_name="Arial", font_size=12.0, flags=flags)
+            span_dict = font.to_span_dict()
+
+            assert span_dict["flags"] == flags
+            assert span_dict["is_bold"] == font.is_bold
+            assert span_dict["is_italic"] == font.is_italic
+            assert span_dict["is_superscript"] == font.is_superscript
+            assert span_dict["is_serif"] == font.is_serif
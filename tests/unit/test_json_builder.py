@@ -0,0 +1,245 @@
+import pytest
+import json
+import logging
+from unittest.mock import Mock
+
+from pdf_extractor.json_builder import JSONBuilder
+from pdf_extractor.models import (
+    ExtractionResult, PageContent, TextBlock, Table, TableCell, ImageInfo,
+    ContentType, BoundingBox, FontInfo
+)
+
+
+def make_extraction_result() -> ExtractionResult:
+    page = PageContent(page_number=1, page_width=595.0, page_height=842.0)
+    page.text_blocks.extend([
+        TextBlock(
+            text="Introduction",
+            content_type=ContentType.HEADER_2,
+            bbox=BoundingBox(10, 10, 100, 30),
+            metadata={"page_number": 1}
+        ),
+        TextBlock(
+            text="Body text with ünïcode.",
+            content_type=ContentType.PARAGRAPH,
+            bbox=BoundingBox(10, 40, 200, 60)
+        ),
+        TextBlock(
+            text="1. First\n2) Second\n\n• Third",
+            content_type=ContentType.LIST
+        ),
+    ])
+    page.tables.append(Table(
+        cells=[
+            TableCell(text="Name", row=0, col=0),
+            TableCell(text="Value", row=0, col=1),
+            TableCell(text="A", row=1, col=0),
+            TableCell(text="1", row=1, col=1),
+        ],
+        rows=2,
+        cols=2,
+        bbox=BoundingBox(10, 100, 200, 150)
+    ))
+    page.images.append(ImageInfo(image_id="img_1", page_number=1))
+
+    return ExtractionResult(
+        file_path="test.pdf",
+        pages=[page],
+        metadata={"title": "Test Document"},
+        processing_time=0.5
+    )
+
+
+class TestJSONBuilder:
+    """Test cases for JSONBuilder class."""
+
+    def test_build_from_extraction_result(self):
+        """Test the hierarchical document layout and summary counts."""
+        builder = JSONBuilder(validate_schema=False)
+        output = builder.build_from_extraction_result(make_extraction_result())
+
+        document = output["document"]
+        assert document["title"] == "Test Document"
+        assert document["summary"]["total_sections"] == 1
+        assert document["summary"]["total_content_blocks"] == 5
+        assert document["summary"]["content_types"] == {
+            "headers": 1,
+            "paragraphs": 1,
+            "tables": 1,
+            "images": 1,
+            "lists": 1
+        }
+
+        items = document["content"][0]["content"]
+        assert [item["type"] for item in items] == [
+            "header", "paragraph", "list", "table", "image"
+        ]
+        assert items[0]["level"] == 2
+        assert [entry["text"] for entry in items[2]["items"]] == ["First", "Second", "Third"]
+        assert items[2]["list_type"] == "ordered"
+        assert items[3]["headers"] == ["Name", "Value"]
+        assert items[3]["data"] == [["A", "1"]]
+
+        assert output["metadata"]["file_path"] == "test.pdf"
+        assert output["metadata"]["page_count"] == 1
+
+    def test_schema_validation_accepts_builder_output(self, caplog):
+        """Test that builder output passes the compiled schema validator."""
+        builder = JSONBuilder(validate_schema=True)
+        if not builder.validate_schema:
+            pytest.skip("No JSON schema validator installed")
+
+        with caplog.at_level(logging.WARNING):
+            builder.build_from_extraction_result(make_extraction_result())
+
+        assert "validation failed" not in caplog.text
+
+    def test_validation_can_be_skipped_per_call(self):
+        """Test that validate=False bypasses the schema validator."""
+        builder = JSONBuilder(validate_schema=True)
+        builder._validate = Mock()
+
+        builder.build_from_extraction_result(make_extraction_result(), validate=False)
+        builder._validate.assert_not_called()
+
+        builder.build_from_extraction_result(make_extraction_result())
+        if builder.validate_schema:
+            builder._validate.assert_called_once()
+
+    def test_font_info_dataclass_is_converted(self):
+        """Test that FontInfo objects are emitted as font_info dicts."""
+        builder = JSONBuilder(validate_schema=False)
+        block = TextBlock(
+            text="Bold text",
+            content_type=ContentType.PARAGRAPH,
+            font_info=FontInfo(font_name="Arial-Bold", font_size=12.0, flags=16)
+        )
+
+        item = builder._convert_content_block_to_item(block)
+
+        assert item["font_info"] == {
+            "font_name": "Arial-Bold",
+            "font_size": 12.0,
+            "is_bold": True,
+            "is_italic": False,
+            "color": 0,
+            "flags": 16
+        }
+
+    def test_to_json_string_matches_stdlib(self):
+        """Test that serialization matches the stdlib json layout."""
+        builder = JSONBuilder(validate_schema=False, indent=2)
+        output = builder.build_from_extraction_result(make_extraction_result())
+
+        expected = json.dumps(output, ensure_ascii=False, indent=2)
+        assert builder.to_json_string(output) == expected
+        assert builder.to_json_bytes(output) == expected.encode('utf-8')
+
+    def test_build_bytes_matches_build_output(self):
+        """Test that build_bytes encodes the same document as the dict API."""
+        builder = JSONBuilder(validate_schema=False)
+        result = make_extraction_result()
+        doc_structure = builder._convert_pages_to_hierarchy(result)
+
+        encoded = builder.build_bytes(doc_structure, result)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == json.loads(json.dumps(
+            builder.build_from_document_structure(doc_structure, result)
+        ))
+
+    def test_save_to_file_round_trip(self, tmp_path):
+        """Test that saved output can be read back unchanged."""
+        builder = JSONBuilder(validate_schema=False)
+        output = builder.build_from_extraction_result(make_extraction_result())
+
+        output_path = tmp_path / "result.json"
+        builder.save_to_file(output, output_path)
+
+        with open(output_path, 'r', encoding='utf-8') as f:
+            assert json.load(f) == json.loads(json.dumps(output))
+
+    def test_save_many_writes_every_document(self, tmp_path):
+        """Test that save_many writes each item to its own path."""
+        builder = JSONBuilder(validate_schema=False)
+        items = [
+            (tmp_path / f"result_{i}.json", {"index": i, "text": "ü"})
+            for i in range(3)
+        ]
+
+        builder.save_many(items)
+
+        for file_path, data in items:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                assert json.load(f) == data
+
+    def test_save_many_logs_only_completed_writes(self, tmp_path, caplog):
+        """Test that a failed write is never reported as saved."""
+        builder = JSONBuilder(validate_schema=False)
+        good_path = tmp_path / "good.json"
+        bad_path = tmp_path / "missing" / "bad.json"
+
+        with caplog.at_level(logging.INFO):
+            with pytest.raises(FileNotFoundError):
+                builder.save_many([(good_path, {"ok": True}), (bad_path, {"ok": False})])
+
+        assert str(good_path) in caplog.text
+        assert str(bad_path) not in caplog.text
+
+    def test_save_to_file_with_stdlib_encoder(self, tmp_path):
+        """Test the streaming stdlib path used when orjson cannot be."""
+        builder = JSONBuilder(validate_schema=False, indent=4)
+        output = builder.build_from_extraction_result(make_extraction_result())
+
+        output_path = tmp_path / "result.json"
+        builder.save_to_file(output, output_path)
+
+        expected = json.dumps(output, ensure_ascii=False, indent=4)
+        assert output_path.read_text(encoding='utf-8') == expected
+    
+    def test_list_bullet_types(self):
+        """Test bullet classification for each supported list prefix."""
+        builder = JSONBuilder(validate_schema=False)
+        block = TextBlock(
+            text="a) Alpha\n- Dash\n* Star\n3. Three\nPlain",
+            content_type=ContentType.LIST
+        )
+
+        items = builder._convert_list_block(block)["items"]
+
+        assert [(item["bullet_type"], item["text"]) for item in items] == [
+            ("letter", "Alpha"),
+            ("bullet", "Dash"),
+            ("bullet", "Star"),
+            ("number", "Three"),
+            ("bullet", "Plain"),
+        ]
+    
+    def test_compact_output_without_indent(self):
+        """Test that indent=None produces compact JSON on every encoder path."""
+        builder = JSONBuilder(validate_schema=False, indent=None)
+        output = builder.build_from_extraction_result(make_extraction_result())
+
+        expected = json.dumps(output, ensure_ascii=False, separators=(',', ':'))
+        assert builder.to_json_string(output) == expected
+        assert builder._separators() == (',', ':')
+    
+    def test_bbox_and_font_info_can_be_omitted(self):
+        """Test that disabled bbox/font_info fields are emitted as null."""
+        builder = JSONBuilder(
+            validate_schema=False, include_bbox=False, include_font_info=False
+        )
+        block = TextBlock(
+            text="Bold text",
+            content_type=ContentType.PARAGRAPH,
+            bbox=BoundingBox(10, 40, 200, 60),
+            font_info=FontInfo(font_name="Arial-Bold", font_size=12.0, flags=16)
+        )
+
+        item = builder._convert_content_block_to_item(block)
+        assert item["bbox"] is None
+        assert item["font_info"] is None
+
+        output = builder.build_from_extraction_result(make_extraction_result())
+        items = output["document"]["content"][0]["content"]
+        assert all(item["bbox"] is None for item in items)
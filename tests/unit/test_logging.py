@@ -1,12 +1,16 @@
 import pytest
 import json
+import logging
 import sys
+from datetime import datetime, timezone
 from io import StringIO
 from unittest.mock import patch
 
 sys.path.insert(0, 'src')
 
-from pdf_extractor.logging_utils import configure_logging, get_logger, PDFExtractorLogger
+from pdf_extractor.logging_utils import (
+    configure_logging, get_logger, PDFExtractorLogger, JSONFormatter
+)
 
 
 class TestLoggingUtils:
@@ -46,12 +50,15 @@ class TestLoggingUtils:
                 assert 'message' in log_entry
                 assert log_entry['message'] == 'Test message'
     
-    def test_pdf_logger_singleton(self):
-        """Test that PDFExtractorLogger is a singleton."""
+    def test_pdf_logger_shares_configuration(self):
+        """Test that PDFExtractorLogger instances share process-wide state."""
         logger1 = PDFExtractorLogger()
         logger2 = PDFExtractorLogger()
         
-        assert logger1 is logger2
+        configure_logging(verbose=False, json_format=True)
+        
+        assert logger1._configured and logger2._configured
+        assert not hasattr(logger1, '__dict__')
     
     def test_extraction_logging_methods(self):
         """Test that extraction-specific logging methods work without errors."""
@@ -79,6 +86,44 @@ class TestLoggingUtils:
             stage="testing"
         )
 
+    def test_log_helpers_skip_disabled_levels(self):
+        """Test that log helpers return early when their level is disabled."""
+        from pdf_extractor.logging_utils import pdf_logger
+
+        logger = logging.getLogger('pdf_extractor.extraction')
+        previous_level = logger.level
+        logger.setLevel(logging.WARNING)
+        try:
+            with patch.object(logger, 'info') as info:
+                pdf_logger.log_extraction_start("test.pdf", {'mode': 'test'})
+                pdf_logger.log_extraction_complete("test.pdf", 1, 0.1)
+            info.assert_not_called()
+        finally:
+            logger.setLevel(previous_level)
+
+    def test_json_formatter_timestamp(self):
+        """Test that timestamps are the record's creation time in UTC."""
+        formatter = JSONFormatter()
+        record = logging.LogRecord('test', logging.INFO, __file__, 1, "msg", None, None)
+
+        for created in (1700000000.25, 1700000000.5, 1700000001.000001):
+            record.created = created
+            log_entry = json.loads(formatter.format(record))
+            expected = datetime.fromtimestamp(created, timezone.utc)
+            assert log_entry['timestamp'] == expected.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+    def test_json_formatter_serializes_extra_data(self):
+        """Test that extra data is merged, including values only json accepts."""
+        formatter = JSONFormatter()
+        record = logging.LogRecord('test', logging.INFO, __file__, 1, "msg", None, None)
+        record.extra_data = {'pages': {1: 'ü'}, 'size': 2 ** 70}
+
+        log_entry = json.loads(formatter.format(record))
+
+        assert log_entry['message'] == 'msg'
+        assert log_entry['pages'] == {'1': 'ü'}
+        assert log_entry['size'] == 2 ** 70
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -238,3 +238,29 @@ class TestPageProcessor:
         text = processor.extract_text_content(page_content)
         
         assert text == "First paragraph.\n\nSecond paragraph."
+    
+    def test_spans_with_same_font_share_font_info(self):
+        """Test that identical span fonts reuse one FontInfo instance."""
+        processor = PageProcessor()
+        span_data = {
+            'text': 'Hello', 'bbox': (0, 0, 10, 10), 'font': 'Arial',
+            'size': 12.0, 'flags': 16, 'color': 0, 'origin': (0, 10)
+        }
+        
+        block = processor._process_block({
+            'number': 0, 'type': 0, 'bbox': (0, 0, 10, 10),
+            'lines': [{
+                'bbox': (0, 0, 10, 10),
+                'spans': [span_data, dict(span_data, text='World')]
+            }, {
+                'bbox': (0, 0, 10, 10),
+                'spans': [dict(span_data, flags=0)]
+            }]
+        })
+        first, second = block.lines[0].spans
+        other, = block.lines[1].spans
+        
+        assert first.font_info is second.font_info
+        assert first.font_info.is_bold
+        assert other.font_info is not first.font_info
+        assert not other.font_info.is_bold